@@ -1,8 +1,5 @@
+import numbers
 import zipfile
-from numpy.lib.recfunctions import (
-    unstructured_to_structured as u2s,
-    structured_to_unstructured as s2u,
-)
 from itertools import permutations, product
 
 import numpy as np
@@ -17,6 +14,37 @@ except ImportError:
 
     # print('using pyfind (python)')
 
+from .pyfind import _chunks, _max_block
+from .pyfind import (
+    set_max_temp_bytes,
+    find_last,
+    last_above,
+    last_nonzero,
+    first_nonzero_packed,
+    last_nonzero_packed,
+    first_where,
+    first_below,
+    first_between,
+    find_n,
+    finditer,
+    find_any,
+    find_many,
+    find_row,
+    find_rows,
+    find_in_file,
+    first_above_in_file,
+    first_nonzero_in_file,
+    find_in_stream,
+    first_above_in_stream,
+    first_nonzero_in_stream,
+    find_sorted_rows,
+    first_above_sorted_rows,
+    FindIndex,
+    make_finder,
+    make_first_above,
+    make_first_nonzero,
+)
+
 __version__ = "0.3.1"
 
 __all__ = (
@@ -26,10 +54,40 @@ __all__ = (
     "nanargmax",
     "T_",
     "sort",
+    "argsort",
+    "nsmallest",
+    "nlargest",
     "irange",
     "find",
+    "find_many",
+    "find_row",
+    "find_rows",
+    "find_in_file",
+    "first_above_in_file",
+    "first_nonzero_in_file",
+    "find_in_stream",
+    "first_above_in_stream",
+    "first_nonzero_in_stream",
+    "find_sorted_rows",
+    "first_above_sorted_rows",
+    "FindIndex",
     "first_above",
     "first_nonzero",
+    "set_max_temp_bytes",
+    "find_last",
+    "last_above",
+    "last_nonzero",
+    "first_nonzero_packed",
+    "last_nonzero_packed",
+    "first_where",
+    "first_below",
+    "first_between",
+    "find_n",
+    "finditer",
+    "find_any",
+    "make_finder",
+    "make_first_above",
+    "make_first_nonzero",
 )
 
 
@@ -73,7 +131,32 @@ def argmax(a):
         return np.argmax(a)
 
 
-def nanargmin(a):
+def _nanarg(a, func, better, max_temp_bytes):
+    """
+    Applies `func` (np.nanargmin or np.nanargmax) to the flattened `a`.
+    `func` copies the whole array to replace the NaNs, so if there is a
+    memory budget (`max_temp_bytes` or the default set by `set_max_temp_bytes`),
+    it is applied block by block instead, `better` (np.less or np.greater)
+    deciding between the winners of the blocks.
+    """
+    max_size = _max_block(a, max_temp_bytes)
+    if max_size is None:
+        return func(a)
+    flat = a.reshape(-1)
+    best, best_value = -1, None
+    for start, stop in _chunks(flat.shape[0], max_size=max_size):
+        block = flat[start:stop]
+        if np.isnan(block).all():
+            continue
+        i = func(block)
+        if best == -1 or better(block[i], best_value):
+            best, best_value = start + i, block[i]
+    if best == -1:
+        raise ValueError("All-NaN slice encountered")
+    return best
+
+
+def nanargmin(a, max_temp_bytes=None):
     """
     Returns the index of the minimum value.
     The result is scalar in 1D case and tuple of indices in 2D and above.
@@ -84,16 +167,21 @@ def nanargmin(a):
     1
     >>> nanargmin([[4,8,5], [9,3,1]])
     (1, 2)
+
+    `np.nanargmin` makes a temporary copy of the array; if `max_temp_bytes`
+    is given (or set with `set_max_temp_bytes`), the array is processed in
+    blocks with the temporaries limited to that size.
     """
     if not isinstance(a, np.ndarray):
         a = np.array(a)
+    i = _nanarg(a, np.nanargmin, np.less, max_temp_bytes)
     if a.ndim > 1:
-        return np.unravel_index(np.nanargmin(a), a.shape)
+        return np.unravel_index(i, a.shape)
     else:
-        return np.nanargmin(a)
+        return i
 
 
-def nanargmax(a):
+def nanargmax(a, max_temp_bytes=None):
     """
     Returns the index of the maximum value.
     The result is scalar in 1D case and tuple of indices in 2D and above.
@@ -104,13 +192,16 @@ def nanargmax(a):
     1
     >>> nanargmax([[4,3,5], [5,nan,3]])
     (0, 2)
+
+    `max_temp_bytes` : same as in `nanargmin`.
     """
     if not isinstance(a, np.ndarray):
         a = np.array(a)
+    i = _nanarg(a, np.nanargmax, np.greater, max_temp_bytes)
     if a.ndim > 1:
-        return np.unravel_index(np.nanargmax(a), a.shape)
+        return np.unravel_index(i, a.shape)
     else:
-        return np.nanargmax(a)
+        return i
 
 
 def T_(x):
@@ -151,6 +242,138 @@ def T_(x):
         return np.swapaxes(x, x.ndim - 2, x.ndim - 1)
 
 
+def _key_columns(by, ncols):
+    """
+    Returns the list of the key columns for `sort`: the `by` columns followed
+    by the remaining columns in the left to right order (they break the ties).
+    """
+    if isinstance(by, (list, tuple)):
+        by = list(by)
+    elif isinstance(by, int):
+        by = [by]
+    elif by is None:
+        by = []
+    else:
+        raise TypeError(f"Unsupported `by` type: {type(by)}")
+    by = [c + ncols if c < 0 else c for c in by]
+    for c in by:
+        if not 0 <= c < ncols:
+            raise ValueError(f"Column {c} is out of range for {ncols} columns")
+    return by + [c for c in range(ncols) if c not in by]
+
+
+def _descending_key(x):
+    """
+    Returns a sort key that orders the elements of `x` in the reverse order
+    (NaN and NaT still go last), so that descending columns need neither
+    negation passes over the data nor signed dtypes:
+    `~x` for bool and ints (no overflow at INT_MIN), `-x` for floats,
+    `~` of the int64 view for datetime64 and timedelta64, and the reversed
+    dense rank for the rest (strings, complex numbers, objects).
+    """
+    if x.dtype.kind in "biu":
+        return ~x
+    elif x.dtype.kind == "f":
+        return -x
+    elif x.dtype.kind in "mM":
+        return ~x.view(np.int64)
+    rank = np.unique(x, return_inverse=True)[1]
+    return ~rank.reshape(x.shape)
+
+
+def _sort_equal(x, y):
+    """
+    Elementwise equality in the sense of sorting: NaNs (NaTs) are equal.
+    """
+    eq = x == y
+    if x.dtype.kind in "fcmM":
+        eq |= np.isnan(x) & np.isnan(y)
+    return eq
+
+
+def _lexsort(keys):
+    """
+    Returns the permutation that sorts the rows (axis -1 of the `keys` arrays)
+    lexicographically by `keys` (primary key first).
+
+    The engine is chosen automatically: the rows are sorted by the primary
+    key (a stable argsort) and, if only few of them are tied, the next keys
+    only reorder the runs of tied rows; otherwise (or for N-D keys)
+    `np.lexsort` sorts by all the keys at once.
+    """
+    if keys[0].ndim > 1:
+        return np.lexsort(keys[::-1], axis=-1)
+    order = np.argsort(keys[0], kind="stable")
+    key = keys[0][order]
+    tie = _sort_equal(key[1:], key[:-1])
+    for key in keys[1:]:
+        if np.count_nonzero(tie) > tie.shape[0] // 2:
+            return np.lexsort(keys[::-1])
+        if not tie.any():
+            break
+        run = np.zeros(order.shape[0], dtype=bool)  # rows with tied neighbours
+        run[1:] |= tie
+        run[:-1] |= tie
+        pos = np.flatnonzero(run)
+        group = np.cumsum(~tie)[np.maximum(pos - 1, 0)]  # the run ids
+        group[pos == 0] = 0
+        rows = order[pos]
+        order[pos] = rows[np.lexsort((key[rows], group))]
+        key = key[order]
+        tie &= _sort_equal(key[1:], key[:-1])
+    return order
+
+
+def argsort(a, by=None, axis=0, ascending=True):
+    """
+    Returns the permutation of the rows that sorts `a` by the specified columns:
+    `sort(a, by, axis, ascending)` is `a[argsort(a, by, axis, ascending)]` for a
+    2D array (`np.take_along_axis(a, argsort(...)[..., None], axis=-2)` in 3D
+    and above, where the rows of each matrix are sorted separately).
+    Useful for rearranging companion arrays by the same keys.
+
+    The parameters and the ordering rules are the same as in `sort`. The sort
+    is stable: the identical rows keep their original order.
+
+    For example:
+    >>> argsort([[1, 2, 3],
+                 [3, 1, 5],
+                 [1, 0, 6]])
+    array([2, 0, 1])
+    >>> argsort([[1, 2], [3, 1], [1, 0]], by=1, ascending=False)
+    array([0, 1, 2])
+    """
+    if isinstance(ascending, (list, tuple, np.ndarray)):
+        if len(ascending) == 1:
+            asc = bool(ascending[0])
+        elif len(ascending) == len(by):
+            asc = list(ascending)
+        else:
+            raise ValueError(
+                f"Length of `ascending`({len(ascending)}) != length of `by`({len(by)})."
+            )
+    elif isinstance(ascending, (bool, int, np.bool_)):
+        asc = bool(ascending)
+
+    a = np.asarray(a)
+    if a.ndim == 0:
+        raise ValueError("Cannot argsort a 0-dimensional array")
+    elif a.ndim == 1:
+        return np.argsort(a if asc is True else _descending_key(a), kind="stable")
+
+    cols = _key_columns(by, a.shape[-1])
+    if not cols:
+        return np.broadcast_to(np.arange(a.shape[-2]), a.shape[:-1]).copy()
+    if isinstance(asc, bool):
+        asc = [asc] * len(cols)
+    else:  # the columns not in `by` are ascending
+        asc = asc + [True] * (len(cols) - len(asc))
+    keys = [
+        a[..., c] if asc1 else _descending_key(a[..., c]) for c, asc1 in zip(cols, asc)
+    ]
+    return _lexsort(keys)
+
+
 def sort(a, by=None, axis=0, ascending=True):
     """
     Rearranges the rows so that the result is sorted by the specified columns
@@ -167,6 +390,13 @@ def sort(a, by=None, axis=0, ascending=True):
 
     `ascending` can be either be a scalar or a list.
 
+    The permutation is computed by `argsort` (with `np.lexsort` on the key
+    columns, see `_lexsort`) and applied with a single `take`, so the array
+    is not converted to a structured one and back. Descending columns are
+    sorted by an order-reversing key (see `_descending_key`), so they work
+    for every dtype (unsigned, bool, strings, datetime64) and the input is
+    never modified.
+
     For example:
     >>>  sort([[1, 2, 3],
                [3, 1, 5],
@@ -175,60 +405,75 @@ def sort(a, by=None, axis=0, ascending=True):
            [1, 2, 3],
            [3, 1, 5]])
     """
-    if isinstance(by, (list, tuple)):
-        order = [f"f{field}" for field in by]
-    elif isinstance(by, int):
-        order = f"f{by}"
-    elif by is None:
-        order = None
-    else:
-        raise TypeError(f"Unsupported `by` type: {type(by)}")
+    a = np.asarray(a)
+    if a.ndim == 0:
+        return a.copy()
+    elif a.ndim == 1 and ascending is True:
+        return np.sort(a)
+    order = argsort(a, by, axis, ascending)
+    if a.ndim == 1:
+        return a[order]
+    return np.take_along_axis(a, order[..., None], axis=-2)
 
-    if isinstance(ascending, (list, tuple, np.ndarray)):
-        if len(ascending) == 1:
-            asc = bool(ascending[0])
-        elif len(ascending) == len(by):
-            asc = list(ascending)
-        else:
-            raise ValueError(
-                f"Length of `ascending`({len(ascending)}) != length of `by`({len(by)})."
-            )
-    elif isinstance(ascending, (bool, int)):
-        asc = bool(ascending)
 
-    # invert columns
-    a = np.array(a)
-    if asc is False:
-        a *= -1
-    elif asc is True:
-        pass
+def _top_k(a, k, by, ascending):
+    """
+    Implementation of `nsmallest` (`ascending=True`) and `nlargest`
+    (`ascending=False`).
+    """
+    a = np.asarray(a)
+    if a.ndim not in (1, 2):
+        raise ValueError(
+            f"`a` is expected to be 1- or 2-dimensional, got {a.ndim}-dimensional array instead"
+        )
+    if isinstance(k, bool) or not isinstance(k, numbers.Integral) or k < 0:
+        raise ValueError(f"`k` must be a non-negative integer, got {k!r}")
+    if a.ndim == 1:
+        col = a
     else:
-        to_negate = []
-        for field, asc1 in zip(by, asc):
-            if asc1 is False:
-                to_negate.append(field)
-        a[..., to_negate] *= -1
+        cols = _key_columns(by, a.shape[1])
+        col = a[:, cols[0]] if cols else None
+    if col is not None and 0 < k < a.shape[0]:
+        # the candidates: the rows with the primary key not worse than the k-th one
+        key = col if ascending else _descending_key(col)
+        kth = np.partition(key, k - 1)[k - 1]
+        if not (key.dtype.kind in "fcmM" and np.isnan(kth)):  # NaN/NaT go last
+            a = a[key <= kth]
+    return sort(a, by, ascending=ascending)[:k]
 
-    # sort
-    if a.ndim > 1:
-        s = u2s(a)
-        s.sort(order=order)
-        u = s2u(s)
-    elif a.ndim == 1:
-        a.sort()
-        u = a
-    else:
-        u = a
 
-    # invert columns back
-    if asc is False:
-        u *= -1
-    elif asc is True:
-        pass
-    else:
-        if to_negate:
-            u[..., to_negate] *= -1
-    return u
+def nsmallest(a, k, by=None):
+    """
+    Returns the first `k` rows of `sort(a, by)` (the first `k` elements in 1D
+    case) without sorting the whole array: the k-th smallest value of the
+    primary key is found with `np.partition`, and only the rows not greater
+    than it are sorted (with all the tie-breaking rules of `sort`), which is
+    O(n + k log k) unless the primary key has many ties.
+
+    For example:
+    >>> nsmallest([[3, 1], [1, 5], [2, 0], [1, 2]], 2)
+    array([[1, 2],
+           [1, 5]])
+    >>> nsmallest([[3, 1], [1, 5], [2, 0], [1, 2]], 2, by=1)
+    array([[2, 0],
+           [3, 1]])
+    """
+    return _top_k(a, k, by, ascending=True)
+
+
+def nlargest(a, k, by=None):
+    """
+    Returns the first `k` rows of `sort(a, by, ascending=False)` (the first
+    `k` elements in 1D case), see `nsmallest`. NaN and NaT are sorted last,
+    like in `sort`.
+
+    For example:
+    >>> nlargest([5, 1, 7, 3], 2)
+    array([7, 5])
+    >>> nlargest([[3, 1], [1, 5], [2, 0], [1, 2]], 1, by=1)
+    array([[1, 5]])
+    """
+    return _top_k(a, k, by, ascending=False)
 
 
 def irange(start, stop, step=1, dtype=None, tol=1e-6, raises=True):
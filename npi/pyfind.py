@@ -1,54 +1,461 @@
+import datetime
+import numbers
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from math import isfinite
+
 import numpy as np
 
+# ______________________________  chunked scan ___________________________________
+
+# Unsorted searches are done block by block: the first block is small so that
+# a hit near the beginning is found almost immediately, and each next block is
+# twice as large (up to _MAX_CHUNK elements) so that the per-block python
+# overhead stays negligible when the hit is far away or absent.
+_MIN_CHUNK = 4096
+_MAX_CHUNK = 1 << 20
+
+# The tests (e.g. np.isclose) allocate a few temporaries of the block's size;
+# with `max_temp_bytes` the block is made small enough for all of them
+# (counted as _TEMP_FACTOR copies of the block) to fit in the budget.
+_TEMP_FACTOR = 4
+
+# The budget used when `max_temp_bytes` is not given (see `set_max_temp_bytes`).
+_default_max_temp_bytes = None
+
+
+def _chunks(n, width=1, max_size=None, reverse=False):
+    """
+    Yields (start, stop) pairs covering range(n) with geometrically growing sizes.
+    `width` is the number of array elements per unit of n (e.g. the number of
+    slices scanned simultaneously); the block sizes are scaled accordingly.
+    `max_size` (elements) overrides _MAX_CHUNK (see `_max_block`).
+    If `reverse` is True, the blocks go from the end of the range to its
+    beginning (the first block is the small one at the end).
+    """
+    cap = _MAX_CHUNK if max_size is None else max_size
+    start, size = 0, min(_MIN_CHUNK, cap)
+    while start < n:
+        stop = min(start + max(size // width, 1), n)
+        if reverse:
+            yield n - stop, n - start
+        else:
+            yield start, stop
+        start = stop
+        size = min(size * 2, cap)
+
+
+def _check_max_temp_bytes(max_temp_bytes):
+    if max_temp_bytes is None:
+        return None
+    if isinstance(max_temp_bytes, bool) or not isinstance(
+        max_temp_bytes, numbers.Integral
+    ):
+        raise TypeError(
+            f"`max_temp_bytes` must be an integer or None, got {max_temp_bytes!r}"
+        )
+    if max_temp_bytes <= 0:
+        raise ValueError("`max_temp_bytes` must be positive")
+    return int(max_temp_bytes)
+
+
+def _max_block(a, max_temp_bytes):
+    """
+    Converts the `max_temp_bytes` budget (the module default if None) to the
+    maximal number of elements of `a` in a block (None = no budget, use
+    _MAX_CHUNK).
+    """
+    if max_temp_bytes is None:
+        if _default_max_temp_bytes is None:
+            return None
+        max_temp_bytes = _default_max_temp_bytes
+    max_temp_bytes = _check_max_temp_bytes(max_temp_bytes)
+    if max_temp_bytes is None:
+        return None
+    return max(max_temp_bytes // (_TEMP_FACTOR * a.dtype.itemsize), 1)
+
+
+def set_max_temp_bytes(max_temp_bytes):
+    """
+    Sets the default memory budget for the temporary arrays of the search
+    functions (and `nanargmin`, `nanargmax`), used when their `max_temp_bytes`
+    argument is not given. `None` removes the limit. Returns the previous
+    value, so that it can be restored.
+
+    For example,
+    >>> old = set_max_temp_bytes(64 * 2**20)
+    >>> find(a, 0.3)  # the temporaries take at most 64MB
+    >>> set_max_temp_bytes(old)
+    """
+    global _default_max_temp_bytes
+    old = _default_max_temp_bytes
+    _default_max_temp_bytes = _check_max_temp_bytes(max_temp_bytes)
+    return old
+
+
+def _block_mask(block, test):
+    """
+    Applies `test` to `block`, returns a boolean mask of the same shape.
+    """
+    mask = np.asarray(test(block))
+    if mask.shape != block.shape:  # e.g. comparison of incompatible types
+        mask = np.broadcast_to(mask, block.shape)
+    return mask
+
+
+def _first_true(mask, reverse=False):
+    """
+    Returns the C-order flat index of the first (last if `reverse` is True)
+    True element of an N-D boolean `mask` or -1 if there is none.
+    Unlike `np.argmax(mask)`, does not copy a mask that is not C-contiguous:
+    the hit is narrowed down one axis at a time with `any` reductions, which
+    numpy computes in the memory order of the mask.
+    """
+    idx = []
+    sub = mask
+    while sub.ndim > 1:
+        rows = sub.any(axis=tuple(range(1, sub.ndim)))
+        i = rows.shape[0] - 1 - np.argmax(rows[::-1]) if reverse else np.argmax(rows)
+        if not rows[i]:
+            return -1
+        idx.append(i)
+        sub = sub[i]
+    i = sub.shape[0] - 1 - np.argmax(sub[::-1]) if reverse else np.argmax(sub)
+    if not sub[i]:
+        return -1
+    idx.append(i)
+    return int(np.ravel_multi_index(idx, mask.shape))
+
+
+def _first_in_block(block, test, reverse=False):
+    """
+    Returns the C-order flat index of the first (last if `reverse` is True)
+    element of `block` for which `test` is True or -1 if there is no such
+    element.
+    """
+    mask = _block_mask(block, test)
+    if mask.ndim > 1:
+        return _first_true(mask, reverse)
+    if reverse:
+        i = mask[::-1].argmax()
+        if mask[-1 - i]:
+            return mask.shape[0] - 1 - i
+        return -1
+    i = mask.argmax()
+    if mask[i]:
+        return i
+    return -1
+
+
+def _blocks(a, max_size=None, reverse=False):
+    """
+    Yields (offset, block) pairs covering `a` in C order (reversed if
+    `reverse` is True): `block` is a view of `a` and its element with the
+    C-order flat index j has the flat index `offset + j` in `a`.
+
+    A C-contiguous array is cut into 1D slices of `a.reshape(-1)`.
+    Any other N-D array (Fortran-ordered, transposed, sliced) is cut along
+    its outer axes instead, without a contiguous copy: each block spans
+    all of the inner axes, and the elementwise tests on it run in memory
+    order.
+    """
+    if a.size == 0:
+        return
+    if a.ndim <= 1 or a.flags.c_contiguous:
+        flat = a.reshape(-1)
+        for start, stop in _chunks(flat.shape[0], max_size=max_size, reverse=reverse):
+            yield start, flat[start:stop]
+        return
+    # blocks are slices along axis k; the axes after it fit into one block
+    cap = _MAX_CHUNK if max_size is None else max_size
+    k, width = a.ndim - 1, 1
+    while k > 0 and width * a.shape[k] <= cap:
+        width *= a.shape[k]
+        k -= 1
+    n_outer = int(np.prod(a.shape[:k]))
+    step = a.shape[k] * width
+    for j in reversed(range(n_outer)) if reverse else range(n_outer):
+        sub = a[np.unravel_index(j, a.shape[:k])]
+        for start, stop in _chunks(a.shape[k], width, max_size, reverse):
+            yield j * step + start * width, sub[start:stop]
+
+
+def _n_workers(workers, sorted=False, axis=None):
+    """
+    Validates the `workers` argument and converts it to the number of threads:
+    None means 1, negative values count back from the number of CPUs
+    (-1 = all of them), like in scipy.
+    """
+    if workers is None:
+        return 1
+    if isinstance(workers, bool) or not isinstance(workers, numbers.Integral):
+        raise TypeError(f"`workers` must be an integer or None, got {workers!r}")
+    if workers == 0:
+        raise ValueError("`workers` must be a nonzero integer or None")
+    if sorted or axis is not None:
+        raise ValueError("`workers` cannot be combined with `sorted=True` or `axis`")
+    if workers < 0:
+        return max((os.cpu_count() or 1) + 1 + workers, 1)
+    return int(workers)
+
+
+def _scan(a, test, workers=None, max_temp_bytes=None, reverse=False):
+    """
+    a ndarray of any shape and memory layout
+    test callable that takes a block of `a` and returns a boolean mask
+    workers number of threads to use (see `_n_workers`)
+    max_temp_bytes memory budget for the temporaries of each block
+        (see `_max_block`); with workers, each thread gets a block of this size
+    reverse if True, scan from the end and return the last hit
+
+    Returns the flat (C-order) index of the first element of `a` for which
+    the mask is True or -1 if there is no such element.
+    """
+    workers = _n_workers(workers)
+    max_size = _max_block(a, max_temp_bytes)
+    if (
+        workers == 1
+        and 0 < a.size <= min(_MIN_CHUNK, max_size or _MIN_CHUNK)
+        and a.flags.c_contiguous
+    ):  # fits in the first block: a single pass, no generators
+        return _first_in_block(a.reshape(-1), test, reverse)
+    blocks = _blocks(a, max_size, reverse)
+    if workers > 1 and a.size > (max_size or _MAX_CHUNK):
+        return _scan_parallel(blocks, test, workers, reverse)
+    for offset, block in blocks:
+        i = _first_in_block(block, test, reverse)
+        if i != -1:
+            return offset + i
+    return -1
+
+
+def _scan_parallel(blocks, test, workers, reverse=False):
+    """
+    Same as `_scan` for the (offset, block) pairs of `_blocks`, but the blocks
+    are scanned by a pool of `workers` threads (numpy releases the GIL in the
+    comparisons).
+
+    The threads take the blocks in order, so once a hit is found, all the
+    blocks before it have already been taken: no new blocks are started,
+    the ones in progress are finished and the smallest (largest if
+    `reverse` is True) hit wins.
+    """
+    lock = threading.Lock()
+    state = {"hit": -1, "stop": False}
+
+    def worker():
+        while True:
+            with lock:
+                if state["stop"] or state["hit"] != -1:
+                    return
+                try:
+                    offset, block = next(blocks)
+                except StopIteration:
+                    return
+            try:
+                i = _first_in_block(block, test, reverse)
+            except BaseException:
+                state["stop"] = True
+                raise
+            if i != -1:
+                with lock:
+                    hit = state["hit"]
+                    if hit == -1 or (offset + i > hit if reverse else offset + i < hit):
+                        state["hit"] = offset + i
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        for future in futures:
+            future.result()
+    return state["hit"]
+
+
+def _scan_axis(a, axis, test, max_temp_bytes=None, reverse=False):
+    """
+    a ndarray of any shape
+    axis the axis along which to search
+    test callable that takes a block of `a` and returns a boolean mask
+    max_temp_bytes memory budget for the temporaries of each block
+    reverse if True, scan from the end and return the last hits
+
+    Returns an int array of shape `a.shape` without `axis` containing
+    the index of the first element of each slice along `axis` for which
+    the mask is True or -1 if there is no such element. All slices are
+    scanned simultaneously block by block, the scan stops as soon as every
+    slice has a hit.
+    """
+    a = np.moveaxis(a, axis, -1)
+    n = a.shape[-1]
+    res = np.full(a.shape[:-1], -1, dtype=np.intp)
+    pending = np.ones(a.shape[:-1], dtype=bool)
+    max_size = _max_block(a, max_temp_bytes)
+    for start, stop in _chunks(n, max(res.size, 1), max_size, reverse):
+        mask = _block_mask(a[..., start:stop], test)
+        hit = pending & mask.any(axis=-1)
+        if reverse:
+            res[hit] = stop - 1 - mask[..., ::-1].argmax(axis=-1)[hit]
+        else:
+            res[hit] = start + mask.argmax(axis=-1)[hit]
+        pending &= ~hit
+        if not pending.any():
+            break
+    return res
+
+
+def _scan_hits(a, test, max_temp_bytes=None):
+    """
+    a ndarray of any shape and memory layout
+    test callable that takes a block of `a` and returns a boolean mask
+
+    Yields, block by block, the arrays of flat (C-order) indices of all the
+    elements of `a` for which the mask is True (blocks without hits are
+    skipped). Stopping the iteration stops the scan.
+    """
+    for offset, block in _blocks(a, _max_block(a, max_temp_bytes)):
+        mask = _block_mask(block, test)
+        if mask.ndim > 1:
+            hits = np.ravel_multi_index(np.nonzero(mask), mask.shape)
+        else:
+            hits = np.flatnonzero(mask)
+        if hits.shape[0]:
+            yield hits + offset
+
+
+def _search(a, test, axis=None, workers=None, max_temp_bytes=None, reverse=False):
+    """
+    Applies `_scan` (if `axis` is None) or `_scan_axis` and converts
+    the result to the output format. The `_*_find` helpers pass their
+    `**scan_kw` (axis, workers, max_temp_bytes, reverse) here.
+    """
+    if axis is None:
+        return _unravel(a, _scan(a, test, workers, max_temp_bytes, reverse))
+    return _scan_axis(a, axis, test, max_temp_bytes, reverse)
+
+
+def _finalize(res, default, raises, message):
+    """
+    Applies the default/raises logic to the result of a search:
+    a scalar, a tuple or (if `axis` was given) an int array with -1 for
+    the slices with no match. A 0-d array (`axis` given for a 1D array) is
+    unwrapped to a scalar.
+    """
+    if isinstance(res, np.ndarray) and res.ndim == 0:
+        res = res[()]
+    if isinstance(res, np.ndarray):
+        missing = res == -1
+        if missing.any():
+            if raises:
+                raise ValueError(message)
+            return np.where(missing, default, res)
+        return res
+    if res == -1:
+        if raises:
+            raise ValueError(message)
+        return default
+    return res
+
+
+def _unravel(a, i):
+    """
+    Converts the flat index `i` returned by `_scan` to the result format:
+    scalar in 1D case and tuple of indices in 2D and above.
+    """
+    if i == -1 or a.ndim <= 1:
+        return i
+    return tuple(np.unravel_index(i, a.shape))
+
+
+def _nonzero_mask(block):
+    """
+    Same truth values as `np.nonzero` uses, computed for a block.
+    """
+    if block.dtype.kind == "b":
+        return block
+    elif block.dtype.kind in "US":
+        return block != block.dtype.type()
+    return block.astype(bool)
+
+
+# ______________________________  find ___________________________________
 
-def _generic_find(a, v, sorted=False):
+
+def _generic_find(a, v, sorted=False, reverse=False, **scan_kw):
     """
     a ndarray with dtype in (int, bool, string, bytes, datetime64, object)
     v scalar with type in (int, bool, string, bytes, datetime64, object)
     """
-    if sorted:
+    if sorted and reverse:
+        i = np.searchsorted(a, v, side="right") - 1
+        if i < 0 or a[i] != v:
+            return -1
+        else:
+            return i
+    elif sorted:
         i = np.searchsorted(a, v)
         if i == a.shape[0] or a[i] != v:
             return -1
         else:
             return i
     else:
-        indices = np.where(a == v)
-        if len(indices[0]):
-            if a.ndim == 1:
-                return indices[0][0]
-            else:
-                return next(zip(*np.where(a == v)))
-        else:
-            return -1
+        return _search(a, lambda x: x == v, reverse=reverse, **scan_kw)
 
 
-def _generic_float_find(a, v, sorted=False):
+def _generic_float_find(a, v, sorted=False, reverse=False, **scan_kw):
     """
     a ndarray with dtype in (complex, float, int, bool, string, bytes, datetime64, object)
     v is nan, inf or NINF
     """
-    if sorted:
+    if sorted and reverse:
+        if np.isnan(v):  # NaNs are sorted to the end
+            n = a.shape[0]
+            return n - 1 if n and np.isnan(a[-1]) else -1
+        i = np.searchsorted(a, v, side="right") - 1
+        if i < 0 or a[i] != v:
+            return -1
+        else:
+            return i
+    elif sorted:
         i = np.searchsorted(a, v)
         if i == a.shape[0]:
             return -1
         elif np.isnan(v) or a[i] == v:
             return i
-    else:
-        if np.isnan(v):
-            indices = np.where(np.isnan(a))
-        else:
-            indices = np.where(a == v)
-        if len(indices[0]):
-            if a.ndim == 1:
-                return indices[0][0]
-            else:
-                return next(zip(*indices))
         else:
             return -1
+    elif np.isnan(v):
+        return _search(a, np.isnan, reverse=reverse, **scan_kw)
+    else:
+        return _search(a, lambda x: x == v, reverse=reverse, **scan_kw)
 
 
-def _nan_find(a, sorted=False):
+_isnan_ufunc = np.frompyfunc(
+    lambda x: isinstance(x, (float, np.datetime64)) and bool(np.isnan(x)), 1, 1
+)
+
+
+def _object_isnan(block):
+    """
+    np.isnan for object arrays: True for float and datetime64 NaNs, False
+    for everything else.
+
+    NaN is the only value not equal to itself (among the usual ones), so
+    the candidates are found with a vectorized `x != x` first, and only
+    they are checked element by element. If `!=` fails (e.g. `pd.NA` or
+    arrays as elements), all the elements are checked.
+    """
+    try:
+        mask = np.asarray(block != block, dtype=bool)
+    except (TypeError, ValueError):
+        mask = None
+    if mask is None or mask.shape != block.shape:
+        return _isnan_ufunc(block).astype(bool)
+    if mask.any():
+        mask[mask] = _isnan_ufunc(block[mask]).astype(bool)
+    return mask
+
+
+def _nan_find(a, sorted=False, **scan_kw):
     """
     a ndarray with dtype == object
     v is nan
@@ -57,159 +464,921 @@ def _nan_find(a, sorted=False):
         raise ValueError(
             "`sorted=True` optimization does not work when v is NaN and a.dtype==object"
         )
-    for i, ai in enumerate(a):
-        if isinstance(ai, (float, np.datetime64)) and np.isnan(ai):
-            return i
-    return -1
+    return _search(a, _object_isnan, **scan_kw)
 
 
-def _float_find_sorted(a, v, rtol=1e-05, atol=1e-08):
+def _str_head(a, n):
     """
-    a ndarray of ints or floats
-    v float
+    a ndarray of 'U' or 'S' dtype
+    Returns a view of the first `n` characters (bytes) of the elements of `a`:
+    a field of a structured dtype with the itemsize of `a`, so no copy is made
+    for any layout. Sorting order is preserved, so the view of a sorted array
+    is sorted too.
     """
-    delta = atol + rtol * abs(v)
-    minv = v - delta
-    maxv = v + delta
-    n = a.shape[0]
-    i = np.searchsorted(a, minv)
-    if i == n or a[i] > maxv:
+    head = np.dtype(a.dtype.str[:2] + str(n))
+    return a.view(
+        np.dtype(
+            {
+                "names": ["head"],
+                "formats": [head],
+                "offsets": [0],
+                "itemsize": a.dtype.itemsize,
+            }
+        )
+    )["head"]
+
+
+def _prefix_find(a, v, sorted=False, **scan_kw):
+    """
+    a ndarray of 'U' or 'S' dtype
+    v str (bytes) prefix
+    """
+    if a.dtype.kind not in "US":
+        raise ValueError(
+            f"`startswith` only works for string and bytes arrays, got {a.dtype}"
+        )
+    vtype = str if a.dtype.kind == "U" else bytes
+    if not isinstance(v, vtype):
+        raise ValueError(f"Incompatible data types of a ({a.dtype}) and v ({type(v)})")
+    v = v.rstrip("\0" if vtype is str else b"\0")  # NUL padding, as in numpy
+    if not v:
+        return _search(a, lambda x: True, **scan_kw)
+    width = a.dtype.itemsize // (4 if a.dtype.kind == "U" else 1)
+    if len(v) < width:
+        a = _str_head(a, len(v))
+    return _generic_find(a, v, sorted=sorted, **scan_kw)
+
+
+def _window_find_sorted(a, lo, hi, reverse=False):
+    """
+    a sorted 1D ndarray (NaNs and NaTs, if any, at the end)
+    lo, hi the bounds of the window (inclusive)
+    Returns the index of the first (last if `reverse` is True) element of `a`
+    within [lo, hi] or -1 by bisection.
+    """
+    if reverse:
+        i = np.searchsorted(a, hi, side="right") - 1
+        if i < 0 or not a[i] >= lo:
+            return -1
+        else:
+            return i
+    i = np.searchsorted(a, lo)
+    if i == a.shape[0] or not a[i] <= hi:  # `not <=` is True for NaN/NaT
         return -1
     else:
         return i
 
 
-def _float_find_unsorted(a, v, rtol=1e-05, atol=1e-08):
+def _float_find_sorted(a, v, rtol=1e-05, atol=1e-08, reverse=False):
     """
     a ndarray of ints or floats
     v float
     """
-    indices = np.where(np.isclose(a, v, rtol=rtol, atol=atol))
-    if len(indices[0]):
-        if a.ndim == 1:
-            return indices[0][0]
-        else:
-            return next(zip(*indices))
-    else:
-        return -1
+    delta = atol + rtol * abs(v)
+    return _window_find_sorted(a, v - delta, v + delta, reverse)
 
 
-def find(a, v, rtol=1e-05, atol=1e-08, sorted=False, default=-1, raises=False):
+def _tolerance_find(a, v, tolerance, sorted=False, **scan_kw):
     """
-    Returns the index of the first element in `a` equal to `v`.
-    If either a or v (or both) is of floating type, the parameters
-    `atol` (absolute tolerance) and `rtol` (relative tolerance)
-    are used for comparison (see `np.isclose()` for details).
+    a ndarray of datetime64 or timedelta64 dtype
+    v datetime64 (timedelta64) scalar
+    tolerance timedelta64 or datetime.timedelta
+    """
+    if a.dtype.kind not in "mM":
+        raise ValueError(
+            f"`tolerance` only works for datetime64 and timedelta64 arrays, got {a.dtype}"
+        )
+    vtype = np.datetime64 if a.dtype.kind == "M" else np.timedelta64
+    if not isinstance(v, vtype):
+        raise ValueError(f"Incompatible data types of a ({a.dtype}) and v ({type(v)})")
+    if isinstance(tolerance, datetime.timedelta):
+        tolerance = np.timedelta64(tolerance)
+    if not isinstance(tolerance, np.timedelta64):
+        raise ValueError(
+            f"`tolerance` must be a timedelta64 or a timedelta, got {tolerance!r}"
+        )
+    if np.isnat(tolerance) or tolerance < np.timedelta64(0):
+        raise ValueError("`tolerance` must be non-negative")
+    if np.isnat(v):
+        return _generic_float_find(a, v, sorted=sorted, **scan_kw)
+    lo, hi = v - tolerance, v + tolerance
+    if sorted:
+        return _window_find_sorted(a, lo, hi, scan_kw["reverse"])
+    return _search(a, lambda x: (x >= lo) & (x <= hi), **scan_kw)
 
-    Otherwise, returns the `default` value (-1 by default)
-    or raises a `ValueError` if `raises=True`.
 
-    In 2D and above the the values in `a` are always tested and returned in
-    row-major, C-style order.
+# float16/32/64 are mapped to the integers of the same size for the `ulps` mode
+_ULP_INTS = {2: np.int16, 4: np.int32, 8: np.int64}
 
-    For example,
-    >>> find([3, 1, 4, 1, 5], 4)
-    2
-    >>> find([1, 2, 3], 7)
-    -1
-    >>> find([1.1, 1.2, 1.3], 1.2)
-    1
-    >>> find(np.arange(0, 1, 0.1), 0.3)
-    3
-    >>> find([[3, 8, 4], [5, 2, 7]], 7)
-    (1, 2)
-    >>> find([[3, 8, 4], [5, 2, 7]], 9)
-    -1
-    >>> find([999980., 999990., 1e6], 1e6)
-    1
-    >>> find([999980., 999990., 1e6], 1e6, rtol=1e-9)
-    2
+
+def _ulp_keys(x):
     """
-    a = np.asarray(a)
+    Maps the floats in `x` to integers so that the order is preserved and
+    adjacent floats map to adjacent integers (+0.0 and -0.0 both map to 0).
+    The mapping is its own inverse when applied to the integers.
+    """
+    bits = x.view(_ULP_INTS[x.dtype.itemsize])
+    imin = bits.dtype.type(np.iinfo(bits.dtype).min)
+    return np.where(bits < 0, imin - bits, bits)
+
+
+def _ulp_window(dtype, v, ulps):
+    """
+    Returns the bounds (as keys, see `_ulp_keys`) of the values at most
+    `ulps` units in the last place away from `v`, clipped to [-inf, inf].
+    """
+    itype = _ULP_INTS[dtype.itemsize]
+    key = int(_ulp_keys(np.array(v, dtype=dtype)))
+    inf = int(_ulp_keys(np.array(np.inf, dtype=dtype)))
+    return itype(max(key - ulps, -inf)), itype(min(key + ulps, inf))
+
+
+def _ulp_test(dtype, v, ulps):
+    """
+    Returns the mask function for the `ulps` mode of `find`.
+    """
+    lo, hi = _ulp_window(dtype, v, ulps)
+
+    def test(x):
+        keys = _ulp_keys(x)
+        return (keys >= lo) & (keys <= hi)
+
+    return test
+
+
+def _ulp_find_sorted(a, v, ulps, reverse=False):
+    """
+    a sorted 1D ndarray of float16/32/64
+    v finite float
+    """
+    lo, hi = (
+        _ulp_keys(np.array(k)).view(a.dtype) for k in _ulp_window(a.dtype, v, ulps)
+    )
+    if reverse:
+        i = np.searchsorted(a, hi, side="right") - 1
+        return i if i >= 0 and a[i] >= lo else -1
+    i = np.searchsorted(a, lo)
+    return i if i < a.shape[0] and a[i] <= hi else -1
+
+
+def _float_find_unsorted(a, v, rtol=1e-05, atol=1e-08, **scan_kw):
+    """
+    a ndarray of ints or floats
+    v float
+    """
+    return _search(a, lambda x: np.isclose(x, v, rtol=rtol, atol=atol), **scan_kw)
 
-    if sorted and a.ndim != 1:
-        raise ValueError(
-            f"`sorted=True` optimization only works for 1D arrays, a.ndim={a.ndim}"
-        )
 
-    complex_mode = float_mode = datetime_mode = nan_mode = False
-    if np.issubdtype(a.dtype, np.complexfloating):
+def _find_mode(a, v):
+    """
+    Chooses how `v` is compared with the elements of `a` in `find`.
+    Returns `v` (converted to complex or float if necessary) and one of
+    "complex", "float" (rtol/atol comparison), "datetime", "nan" (NaN in
+    an object or string array) and "generic" (exact comparison).
+    """
+    kind = a.dtype.kind  # faster than the dtype hierarchy checks
+    if kind == "c":
         if not isinstance(v, complex):
             v = complex(v)
-        complex_mode = True
+        return v, "complex"
     elif isinstance(v, complex):
-        complex_mode = True
-    elif np.issubdtype(a.dtype, np.floating):
+        return v, "complex"
+    elif kind == "f":
         if not isinstance(v, float):
             v = float(v)
-        float_mode = True
-    elif np.issubdtype(a.dtype, np.number) and isinstance(v, float):
-        float_mode = True
-    elif np.issubdtype(a.dtype, np.datetime64):
+        return v, "float"
+    elif kind in "iufcm" and isinstance(v, float):  # np.number
+        return v, "float"
+    elif kind == "M":
         if not isinstance(v, np.datetime64):
             raise ValueError(
                 f"Incompatible data types of a ({a.dtype}) and v ({type(v)})"
             )
-        datetime_mode = True
+        return v, "datetime"
     elif isinstance(v, (float, np.datetime64)) and np.isnan(v):
-        nan_mode = True
+        return v, "nan"
+    return v, "generic"
+
+
+def _find_test(v, mode, rtol, atol):
+    """
+    Returns the mask function for the elements of `a` equal to `v` in
+    the `find` sense (`v` and `mode` as returned by `_find_mode`); this is
+    the test the unsorted `find` paths scan with.
+    """
+    if mode == "nan":
+        return _object_isnan
+    if mode in ("complex", "float") and np.isfinite(v):
+        return lambda x: np.isclose(x, v, rtol=rtol, atol=atol)
+    if mode in ("complex", "float", "datetime") and np.isnan(v):
+        return np.isnan
+    return lambda x: x == v
+
+
+def _find(
+    a,
+    v,
+    rtol,
+    atol,
+    ulps,
+    sorted,
+    default,
+    raises,
+    axis,
+    workers,
+    max_temp_bytes,
+    startswith,
+    tolerance,
+    reverse,
+):
+    """
+    Implementation of `find` (`reverse=False`) and `find_last` (`reverse=True`).
+    """
+    a = np.asarray(a)
+    workers = _n_workers(workers, sorted, axis)
+    scan_kw = dict(
+        axis=axis, workers=workers, max_temp_bytes=max_temp_bytes, reverse=reverse
+    )
+
+    if sorted and axis is not None:
+        raise ValueError("`sorted=True` optimization cannot be combined with `axis`")
+    if sorted and a.ndim != 1:
+        raise ValueError(
+            f"`sorted=True` optimization only works for 1D arrays, a.ndim={a.ndim}"
+        )
+
+    if ulps is not None:
+        if isinstance(ulps, bool) or not isinstance(ulps, numbers.Integral):
+            raise TypeError(f"`ulps` must be an integer or None, got {ulps!r}")
+        if a.dtype.kind != "f" or a.dtype.itemsize not in _ULP_INTS:
+            raise ValueError(
+                f"`ulps` only works for float16, float32 and float64 arrays, got {a.dtype}"
+            )
+        if ulps < 0:
+            raise ValueError("`ulps` must be non-negative")
+        ulps = int(ulps)
+
+    if startswith:
+        res = _prefix_find(a, v, sorted=sorted, **scan_kw)
+        return _finalize(res, default, raises, f"No element starts with {v!r}")
+
+    if tolerance is not None:
+        res = _tolerance_find(a, v, tolerance, sorted=sorted, **scan_kw)
+        return _finalize(res, default, raises, f"{v} is not in array")
+
+    v, mode = _find_mode(a, v)
+
+    if ulps is not None:
+        if mode != "float":
+            raise ValueError(f"`ulps` cannot be used with a {type(v).__name__} `v`")
+        if np.isfinite(v):
+            mode = "ulps"
 
-    if complex_mode:
+    if mode == "ulps":
+        if sorted:
+            res = _ulp_find_sorted(a, v, ulps, reverse=reverse)
+        else:
+            res = _search(a, _ulp_test(a.dtype, v, ulps), **scan_kw)
+    elif mode == "complex":
         if sorted:
             raise ValueError(
                 "`sorted=True` optimization cannot be used with complex numbers"
             )
         elif np.isfinite(v):
-            res = _float_find_unsorted(a, v, rtol=rtol, atol=atol)
+            res = _float_find_unsorted(a, v, rtol=rtol, atol=atol, **scan_kw)
         else:
-            res = _generic_float_find(a, v, sorted=False)
-    elif float_mode:
+            res = _generic_float_find(a, v, sorted=False, **scan_kw)
+    elif mode == "float":
         if np.isfinite(v):
             if sorted:
-                res = _float_find_sorted(a, v, rtol=rtol, atol=atol)
+                res = _float_find_sorted(a, v, rtol=rtol, atol=atol, reverse=reverse)
             else:
-                res = _float_find_unsorted(a, v, rtol=rtol, atol=atol)
+                res = _float_find_unsorted(a, v, rtol=rtol, atol=atol, **scan_kw)
         else:
-            res = _generic_float_find(a, v, sorted=sorted)
-    elif datetime_mode and np.isnat(v):
-        res = _generic_float_find(a, v, sorted=sorted)
-    elif nan_mode:
-        res = _nan_find(a, sorted=sorted)
+            res = _generic_float_find(a, v, sorted=sorted, **scan_kw)
+    elif mode == "datetime" and np.isnat(v):
+        res = _generic_float_find(a, v, sorted=sorted, **scan_kw)
+    elif mode == "nan":
+        res = _nan_find(a, sorted=sorted, **scan_kw)
     else:
-        res = _generic_find(a, v, sorted=sorted)
+        res = _generic_find(a, v, sorted=sorted, **scan_kw)
 
-    if res == -1:
-        if raises:
-            raise ValueError(f"{v} is not in array")
-        else:
-            return default
-    return res
+    return _finalize(res, default, raises, f"{v} is not in array")
 
 
-# ____________________________  first_above ________________________________
+def find(
+    a,
+    v,
+    rtol=1e-05,
+    atol=1e-08,
+    sorted=False,
+    default=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+    ulps=None,
+    startswith=False,
+    tolerance=None,
+):
+    """
+    Returns the index of the first element in `a` equal to `v`.
+    If either a or v (or both) is of floating type, the parameters
+    `atol` (absolute tolerance) and `rtol` (relative tolerance)
+    are used for comparison (see `np.isclose()` for details).
 
+    Otherwise, returns the `default` value (-1 by default)
+    or raises a `ValueError` if `raises=True`.
 
-def first_above(a, v, sorted=False, missing=-1, raises=False):
-    """
-     Returns the index of the first element in `a` strictly greater than `v`.
-     If either a or v (or both) is of floating type, the parameters
-     `atol` (absolute tolerance) and `rtol` (relative tolerance)
-     are used for comparison (see `np.isclose()` for details).
+    In 2D and above the the values in `a` are always tested and returned in
+    row-major, C-style order.
 
-     In 2D and above the the values in `a` are always tested and returned in
-     row-major, C-style order.
+    If `axis` is given, each slice along `axis` is searched separately and
+    an int array of the first indices in each slice (`default` for the slices
+    with no match) is returned.
 
-     If there is no value in `a` greater than `v`, returns the `default` value
-     (-1 by default) or raises a `ValueError` if `raises=True`.
+    If `workers` is given, the array is scanned by that many threads
+    (-1 = one per CPU). The result is the same, but a search through
+    a huge array is faster. Cannot be combined with `sorted=True` or `axis`.
 
-     Parameters
-     ----------
-     v : scalar
-    `a` : 1-D array_like
-    `v` : scalar
-    `sorted` : use bisection to further accelerate the search. Only works for sorted arrays.
+    The array is scanned in blocks, so the temporary arrays (e.g. the ones
+    allocated by `np.isclose`) are much smaller than `a`; `max_temp_bytes`
+    puts an explicit limit on their total size per block (per thread).
+    Together with the early exit this allows searching an `np.memmap`
+    larger than RAM (see also `find_in_file`).
+
+    If `ulps` (a non-negative integer) is given (float16, float32 and float64
+    arrays and real `v` only), it replaces `rtol` and `atol`: the elements at
+    most `ulps` representable values away from `v` (in the dtype of `a`)
+    match. The distance is computed on the integer bit patterns, which is
+    cheaper than `np.isclose`.
+
+    If `startswith` is True (string and bytes arrays only), the first element
+    starting with `v` is returned. The prefixes are compared through a view
+    of the first len(v) characters of each element, so no strings are copied.
+
+    If `tolerance` is given (datetime64 and timedelta64 arrays only; a
+    `np.timedelta64` or a `datetime.timedelta`), the elements at most
+    `tolerance` away from `v` match, e.g. "the first timestamp within 5 ms
+    of t". With `sorted=True` this is a bisection.
+
+    For example,
+    >>> find([3, 1, 4, 1, 5], 4)
+    2
+    >>> find([1, 2, 3], 7)
+    -1
+    >>> find([1.1, 1.2, 1.3], 1.2)
+    1
+    >>> find(np.arange(0, 1, 0.1), 0.3)
+    3
+    >>> find([[3, 8, 4], [5, 2, 7]], 7)
+    (1, 2)
+    >>> find([[3, 8, 4], [5, 2, 7]], 9)
+    -1
+    >>> find([999980., 999990., 1e6], 1e6)
+    1
+    >>> find([999980., 999990., 1e6], 1e6, rtol=1e-9)
+    2
+    >>> find([[3, 8, 4], [5, 2, 7]], 4, axis=1)
+    array([ 2, -1])
+    >>> find(np.float32([1, 1.0000001, 1.0000002]), np.float32(1.0000002), ulps=1)
+    1
+    >>> find(["ab12", "cd34", "cd56"], "cd", startswith=True)
+    1
+    >>> t = np.datetime64("2024-01-01T00:00:00.000")
+    >>> find(t + np.array([0, 20, 40], "m8[ms]"), t + np.timedelta64(18, "ms"),
+    ...      tolerance=np.timedelta64(5, "ms"))
+    1
+    """
+    return _find(
+        a,
+        v,
+        rtol,
+        atol,
+        ulps,
+        sorted,
+        default,
+        raises,
+        axis,
+        workers,
+        max_temp_bytes,
+        startswith,
+        tolerance,
+        reverse=False,
+    )
+
+
+def find_last(
+    a,
+    v,
+    rtol=1e-05,
+    atol=1e-08,
+    sorted=False,
+    default=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+    ulps=None,
+    startswith=False,
+    tolerance=None,
+):
+    """
+    Returns the index of the last element in `a` equal to `v`.
+
+    Same as `find` (the same comparison rules and parameters), but the
+    array is scanned from the end, so the search time depends on the
+    distance of the match from the end of the array. In 2D and above the
+    last match in row-major, C-style order is returned.
+
+    For example,
+    >>> find_last([3, 1, 4, 1, 5], 1)
+    3
+    >>> find_last([[3, 8, 4], [5, 2, 4]], 4)
+    (1, 2)
+    >>> find_last([[3, 8, 4], [4, 2, 7]], 4, axis=1)
+    array([2, 0])
+    """
+    return _find(
+        a,
+        v,
+        rtol,
+        atol,
+        ulps,
+        sorted,
+        default,
+        raises,
+        axis,
+        workers,
+        max_temp_bytes,
+        startswith,
+        tolerance,
+        reverse=True,
+    )
+
+
+# ______________________________  find_n ___________________________________
+
+
+def find_n(a, v, k, rtol=1e-05, atol=1e-08, max_temp_bytes=None):
+    """
+    Returns the indices of the first `k` elements in `a` equal to `v`
+    (fewer if there are not so many matches). The comparison rules are
+    the same as in `find`.
+
+    Unlike `np.nonzero(a == v)`, the array is scanned block by block and the
+    scan stops as soon as `k` matches are found.
+
+    The result is an int array in 1D case and a tuple of such arrays
+    (one per dimension, like in `np.nonzero`) in 2D and above, in C order.
+
+    For example,
+    >>> find_n([3, 1, 4, 1, 5, 1], 1, 2)
+    array([1, 3])
+    >>> find_n([[3, 1, 4], [1, 5, 1]], 1, 2)
+    (array([0, 1]), array([1, 0]))
+    """
+    a = np.asarray(a)
+    test = _find_test(*_find_mode(a, v), rtol, atol)
+    found, count = [], 0
+    if k > 0:
+        for hits in _scan_hits(a, test, max_temp_bytes):
+            found.append(hits[: k - count])
+            count += found[-1].shape[0]
+            if count >= k:
+                break
+    res = np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+    if a.ndim > 1:
+        return tuple(np.unravel_index(res, a.shape))
+    return res
+
+
+def finditer(a, v, rtol=1e-05, atol=1e-08, max_temp_bytes=None):
+    """
+    Lazily yields the indices of the elements in `a` equal to `v`
+    (ints in 1D case, tuples in 2D and above, in C order). The comparison
+    rules are the same as in `find`.
+
+    The array is scanned block by block when the iteration reaches it, so
+    stopping the iteration early skips the rest of the array.
+
+    For example,
+    >>> for i in finditer([3, 1, 4, 1, 5, 1], 1):
+    ...     print(i)
+    1
+    3
+    5
+    """
+    a = np.asarray(a)
+    test = _find_test(*_find_mode(a, v), rtol, atol)
+    for hits in _scan_hits(a, test, max_temp_bytes):
+        if a.ndim > 1:
+            yield from zip(*(idx.tolist() for idx in np.unravel_index(hits, a.shape)))
+        else:
+            yield from hits.tolist()
+
+
+# ______________________________  find_any ___________________________________
+
+
+def _member_test(a, values, rtol, atol):
+    """
+    Returns the mask function for the elements of `a` equal (in the `find`
+    sense) to any of `values` (a 1D array). The values are sorted once, so
+    testing an element costs a bisection instead of len(values) comparisons.
+    """
+    complex_or_object = any(
+        np.issubdtype(dt, np.complexfloating) or dt == object
+        for dt in (a.dtype, values.dtype)
+    )
+    if complex_or_object or values.shape[0] == 0:
+        tests = [_find_test(*_find_mode(a, v), rtol, atol) for v in values.tolist()]
+
+        def test(x):
+            mask = np.zeros(x.shape, dtype=bool)
+            for t in tests:
+                mask |= _block_mask(x, t)
+            return mask
+
+        return test
+
+    if np.issubdtype(a.dtype, np.floating) or (
+        np.issubdtype(a.dtype, np.number) and np.issubdtype(values.dtype, np.floating)
+    ):
+        values = values.astype(float)
+        finite = values[np.isfinite(values)]
+        infs = values[np.isinf(values)]
+        has_nan = bool(np.isnan(values).any())
+        delta = atol + rtol * np.abs(finite)
+        order = np.argsort(finite - delta)
+        lo = (finite - delta)[order]
+        # x is within some window [lo[j], hi[j]] iff the largest hi[j] among
+        # the windows starting at or before x is >= x
+        hi_max = np.maximum.accumulate((finite + delta)[order])
+
+        def test(x):
+            i = np.searchsorted(lo, x, side="right")
+            mask = (i > 0) & (hi_max[np.maximum(i - 1, 0)] >= x) if lo.size else False
+            mask = mask | np.isin(x, infs)
+            if has_nan:
+                mask = mask | np.isnan(x)
+            return mask
+
+        return test
+
+    if np.issubdtype(a.dtype, np.datetime64):
+        if not np.issubdtype(values.dtype, np.datetime64):
+            raise ValueError(
+                f"Incompatible data types of a ({a.dtype}) and values ({values.dtype})"
+            )
+        has_nat = bool(np.isnat(values).any())
+        table = np.unique(values[~np.isnat(values)])
+    else:
+        has_nat = False
+        table = np.unique(values)
+
+    def test(x):
+        i = np.minimum(np.searchsorted(table, x), table.shape[0] - 1)
+        mask = table[i] == x if table.size else np.zeros(x.shape, dtype=bool)
+        if has_nat:
+            mask = mask | np.isnat(x)
+        return mask
+
+    return test
+
+
+def find_any(
+    a,
+    values,
+    rtol=1e-05,
+    atol=1e-08,
+    default=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the first element in `a` equal to any of `values`.
+
+    Same as `min(find(a, v) for v in values)` (ignoring the misses), but
+    the array is scanned once: `values` are sorted into a lookup table and
+    each block of `a` is tested against all of them by bisection, stopping
+    at the first block with a match. The comparison rules (`rtol`, `atol`,
+    NaN, inf, NaT) and the other parameters are the same as in `find`.
+
+    For example,
+    >>> find_any([3, 1, 4, 1, 5], [5, 4])
+    2
+    >>> find_any([[3, 8, 4], [5, 2, 7]], [7, 2])
+    (1, 1)
+    >>> find_any([1.1, 1.2, 1.3], [1.3, 1.2])
+    1
+    """
+    a = np.asarray(a)
+    values = np.asarray(values).reshape(-1)
+    workers = _n_workers(workers, axis=axis)
+    res = _search(
+        a,
+        _member_test(a, values, rtol, atol),
+        axis=axis,
+        workers=workers,
+        max_temp_bytes=max_temp_bytes,
+    )
+    return _finalize(res, default, raises, "None of the values is in array")
+
+
+# ____________________________  find_many ________________________________
+
+
+def _min_in_windows(order, lo, hi):
+    """
+    order 1D array of ints with len(order) > max(hi)
+    lo, hi 1D arrays of window bounds, lo <= hi
+
+    Returns min(order[lo[k]:hi[k]]) for each k (order[lo[k]] for empty windows).
+    """
+    # reduceat also reduces the gaps between the windows; processing the windows
+    # in the order of `lo` keeps the total length of the gaps below len(order).
+    perm = np.argsort(lo, kind="stable")
+    idx = np.empty(2 * lo.shape[0], dtype=np.intp)
+    idx[0::2] = lo[perm]
+    idx[1::2] = hi[perm]
+    res = np.empty(lo.shape[0], dtype=order.dtype)
+    if lo.shape[0]:
+        res[perm] = np.minimum.reduceat(order, idx)[0::2]
+    return res
+
+
+def find_many(a, values, rtol=1e-05, atol=1e-08, default=-1, raises=False):
+    """
+    Returns the indices of the first elements in `a` equal to each of `values`.
+    Gives the same results as `[find(a, v) for v in values]` but sorts `a` only
+    once and looks up all the values by bisection, so the complexity is
+    O((n + m) log n) instead of O(n*m).
+
+    The rules for the floating point comparison (`rtol`, `atol`), NaN, inf
+    and NaT are the same as in `find`. Object and complex arrays are not
+    sortable in a meaningful way, so for them `find` is called for each value.
+
+    The result is an int array of the same shape as `values` in 1D case and
+    a tuple of such arrays (one per dimension, like in `np.nonzero`) in 2D
+    and above. Values not present in `a` get the `default` index (-1 by default)
+    or raise a `ValueError` if `raises=True`.
+
+    For example,
+    >>> find_many([3, 1, 4, 1, 5], [1, 5, 9])
+    array([ 1,  4, -1])
+    >>> find_many([[3, 8, 4], [5, 2, 7]], [7, 3])
+    (array([1, 0]), array([2, 0]))
+    """
+    return FindIndex(a).find_many(
+        values, rtol=rtol, atol=atol, default=default, raises=raises
+    )
+
+
+# ____________________________  find_row ________________________________
+
+
+def _prepare_table(a, rows):
+    """
+    Validates the 2D table `a` and the row(s) `rows` (the last dimension must
+    match) and converts `rows` to the dtype of `a`. Returns `a`, the converted
+    rows and the mask of the rows that survived the conversion unchanged (the
+    other ones, e.g. 1.5 in an int table or a row with a NaN, cannot match).
+    """
+    a = np.asarray(a)
+    if a.ndim != 2:
+        raise ValueError(
+            f"`a` is expected to be 2-dimensional, got {a.ndim}-dimensional array instead"
+        )
+    rows = np.asarray(rows)
+    if rows.ndim == 0 or rows.shape[-1] != a.shape[1]:
+        raise ValueError(
+            f"Row length mismatch: the table has {a.shape[1]} columns, "
+            f"got rows of shape {rows.shape}"
+        )
+    try:
+        with np.errstate(invalid="ignore", over="ignore"):
+            cast = rows.astype(a.dtype)
+            valid = np.asarray(cast == rows)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Incompatible data types of a ({a.dtype}) and rows ({rows.dtype})"
+        ) from None
+    return a, cast, np.broadcast_to(valid, rows.shape).all(axis=-1)
+
+
+def _row_keys(a):
+    """
+    Returns a 1D view of the rows of the 2D array `a` as opaque void scalars,
+    so that a row is compared with a single `memcmp`-like comparison.
+    The rows must be contiguous (`a.strides[1] == a.itemsize`).
+    """
+    return a.view(np.dtype((np.void, a.dtype.itemsize * a.shape[1])))[:, 0]
+
+
+def _row_less(x, y):
+    """
+    True if the 1D array `x` is lexicographically smaller than `y`.
+    """
+    d = np.flatnonzero(x != y)
+    return d.shape[0] > 0 and bool(x[d[0]] < y[d[0]])
+
+
+def find_row(a, row, sorted=False, default=-1, raises=False, max_temp_bytes=None):
+    """
+    Returns the index of the first row of the 2D table `a` equal to `row`
+    (exact comparison, like `(a == row).all(axis=1)`, but without the n×k
+    temporary array and with early exit).
+
+    Rows of int, bool, string and bytes tables are compared as opaque byte
+    strings (a void view of each row, no copy); other tables (and the tables
+    whose rows are not contiguous) are compared column by column, block by
+    block.
+
+    If `sorted=True`, the table must be sorted lexicographically (e.g. with
+    `a[np.lexsort(a.T[::-1])]`) and the row is found by bisection:
+    O(k log n) instead of O(n k).
+
+    Otherwise, returns the `default` value (-1 by default)
+    or raises a `ValueError` if `raises=True`.
+
+    `max_temp_bytes` limits the size of the temporary arrays per block
+    (see `find`).
+
+    For example,
+    >>> find_row([[1, 2], [3, 4], [3, 4]], [3, 4])
+    1
+    >>> find_row([[1, 2], [3, 4]], [4, 3])
+    -1
+    """
+    a, row, valid = _prepare_table(a, row)
+    if row.ndim != 1:
+        raise ValueError(f"`row` is expected to be 1-dimensional, got {row.ndim}")
+    n, k = a.shape
+    if not valid:
+        res = -1
+    elif k == 0:
+        res = 0 if n else -1
+    elif sorted:
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _row_less(a[mid], row):
+                lo = mid + 1
+            else:
+                hi = mid
+        res = lo if lo < n and np.array_equal(a[lo], row) else -1
+    elif a.dtype.kind in "biuSU" and a.strides[1] == a.itemsize:
+        key = _row_keys(np.ascontiguousarray(row).reshape(1, k))[0]
+        res = _scan(_row_keys(a), lambda x: x == key, max_temp_bytes=max_temp_bytes)
+    else:
+        res = -1
+        max_size = _max_block(a, max_temp_bytes)
+        for start, stop in _chunks(n, k, max_size):
+            block = a[start:stop]
+            mask = block[:, 0] == row[0]
+            for j in range(1, k):
+                mask &= block[:, j] == row[j]
+            i = np.argmax(mask)
+            if mask[i]:
+                res = start + i
+                break
+    return _finalize(res, default, raises, f"{row.tolist()} is not in the table")
+
+
+def find_rows(a, rows, hashed=False, default=-1, raises=False):
+    """
+    Returns the indices of the first rows of the 2D table `a` equal to each
+    of `rows` (an m×k array). Gives the same results as
+    `[find_row(a, r) for r in rows]`, but the rows of `a` are sorted (as
+    opaque byte strings) only once and all the rows are looked up by
+    bisection: O((n + m) log n) instead of O(n m).
+
+    If `hashed=True`, a dict of the first occurrences of the rows of `a` is
+    built instead and each row is looked up in O(1).
+
+    Rows not present in `a` get the `default` index (-1 by default)
+    or raise a `ValueError` if `raises=True`.
+
+    For example,
+    >>> find_rows([[1, 2], [3, 4], [3, 4]], [[3, 4], [5, 6], [1, 2]])
+    array([ 1, -1,  0])
+    """
+    a, rows, valid = _prepare_table(a, rows)
+    if rows.ndim != 2:
+        raise ValueError(f"`rows` is expected to be 2-dimensional, got {rows.ndim}")
+    n, k = a.shape
+    if k == 0 or n == 0:
+        res = np.full(rows.shape[0], 0 if n else -1, dtype=np.intp)
+    elif a.dtype.kind in "biuSU":
+        res = _find_key_rows(a, rows, hashed)
+    elif a.dtype.kind in "fc":
+        # -0.0 -> 0.0, so that equal rows have equal bytes (NaN rows are not valid)
+        res = _find_key_rows(a + 0.0, rows + 0.0, hashed)
+    else:  # datetime (NaT), object
+        res = np.array([find_row(a, r) for r in rows], dtype=np.intp)
+    res[~valid] = -1
+    missing = res == -1
+    if missing.any():
+        if raises:
+            raise ValueError(f"{rows[missing][0].tolist()} is not in the table")
+        return np.where(missing, default, res)
+    return res
+
+
+def _find_key_rows(a, rows, hashed):
+    """
+    `find_rows` implementation on the void keys of the rows (equal rows must
+    have equal bytes).
+    """
+    keys, first = np.unique(_row_keys(np.ascontiguousarray(a)), return_index=True)
+    query = _row_keys(np.ascontiguousarray(rows))
+    if hashed:
+        table = dict(zip(keys.tolist(), first.tolist()))
+        return np.array([table.get(q, -1) for q in query.tolist()], dtype=np.intp)
+    i = np.searchsorted(keys, query)
+    found = i < keys.shape[0]
+    found[found] = keys[i[found]] == query[found]
+    return np.where(found, first[np.minimum(i, keys.shape[0] - 1)], -1)
+
+
+# ____________________________  first_above ________________________________
+
+
+def _above(a, v, sorted, missing, raises, axis, workers, max_temp_bytes, reverse):
+    """
+    Implementation of `first_above` (`reverse=False`) and `last_above`
+    (`reverse=True`).
+    """
+    a = np.asarray(a)
+    _check_comparable(a, v)
+    workers = _n_workers(workers, sorted, axis)
+
+    if axis is not None:
+        if sorted:
+            raise ValueError(
+                "`sorted=True` optimization cannot be combined with `axis`"
+            )
+        res = _scan_axis(a, axis, lambda x: x > v, max_temp_bytes, reverse)
+    elif a.ndim != 1:
+        raise ValueError(
+            f"`a` is expected to be 1-dimensional, got {a.ndim}-dimensional array instead"
+        )
+    elif sorted:
+        end = a.shape[0]
+        if a.dtype.kind in "fmM":  # NaNs (NaTs) are sorted to the end
+            end = np.searchsorted(
+                a, a.dtype.type("NaT" if a.dtype.kind in "mM" else "nan")
+            )
+        res = np.searchsorted(a[:end], v, side="right")
+        if res == end:
+            res = -1
+        elif reverse:  # if any non-NaN element is above v, the last one is
+            res = end - 1
+    else:
+        res = _scan(a, lambda x: x > v, workers, max_temp_bytes, reverse)
+
+    return _finalize(res, missing, raises, f"No values above {v} in the array")
+
+
+def first_above(
+    a,
+    v,
+    sorted=False,
+    missing=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+     Returns the index of the first element in `a` strictly greater than `v`.
+     If either a or v (or both) is of floating type, the parameters
+     `atol` (absolute tolerance) and `rtol` (relative tolerance)
+     are used for comparison (see `np.isclose()` for details).
+
+     In 2D and above the the values in `a` are always tested and returned in
+     row-major, C-style order.
+
+     If there is no value in `a` greater than `v`, returns the `default` value
+     (-1 by default) or raises a `ValueError` if `raises=True`.
+
+     Parameters
+     ----------
+     v : scalar
+    `a` : 1-D array_like
+    `v` : scalar
+    `sorted` : use bisection to further accelerate the search. Only works for sorted arrays.
     `missing` : the value to return if no element in `a` is greater than `v`
     `raises` : if `True` return an exception instead of returning anything
+    `axis` : if given, search each slice along `axis` separately and return an
+        int array of the first indices in each slice (`missing` for no match);
+        `a` can then be of any dimension
+    `workers` : the number of threads to scan the array with (-1 = one per CPU);
+        cannot be combined with `sorted=True` or `axis`
+    `max_temp_bytes` : the limit on the size of the temporary arrays per block
 
      For example,
      >>> first_above([4, 5, 8, 2, 7], 6)
@@ -218,49 +1387,83 @@ def first_above(a, v, sorted=False, missing=-1, raises=False):
      (0, 2)
      >>> first_above([5, 6, 7], 9)
      3
+     >>> first_above([[4, 5, 8], [2, 7, 3]], 6, axis=1)
+     array([2, 1])
     """
-    a = np.asarray(a)
+    return _above(
+        a, v, sorted, missing, raises, axis, workers, max_temp_bytes, reverse=False
+    )
 
-    if np.issubdtype(a.dtype, complex) or isinstance(v, complex):
-        raise ValueError("Complex numbers are not comparable.")
 
-    if np.issubdtype(a.dtype, bool) or isinstance(v, bool):
-        raise ValueError("`bool` type is not supported.")
+def last_above(
+    a,
+    v,
+    sorted=False,
+    missing=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the last element in `a` strictly greater than `v`.
+
+    Same as `first_above` (the same parameters and restrictions), but the
+    array is scanned from the end.
+
+    For example,
+    >>> last_above([4, 5, 8, 2, 7], 6)
+    4
+    >>> last_above([[4, 5, 8], [7, 2, 3]], 6, axis=1)
+    array([2, 0])
+    """
+    return _above(
+        a, v, sorted, missing, raises, axis, workers, max_temp_bytes, reverse=True
+    )
+
+
+# ______________________________  first_nonzero ___________________________________
+
+
+def _nonzero(a, missing, raises, axis, workers, max_temp_bytes, reverse):
+    """
+    Implementation of `first_nonzero` (`reverse=False`) and `last_nonzero`
+    (`reverse=True`).
+    """
+    a = np.asarray(a)
+    workers = _n_workers(workers, axis=axis)
 
-    if a.ndim != 1:
+    if axis is not None:
+        res = _scan_axis(a, axis, _nonzero_mask, max_temp_bytes, reverse)
+    elif a.ndim != 1:
         raise ValueError(
             f"`a` is expected to be 1-dimensional, got {a.ndim}-dimensional array instead"
         )
-
-    if sorted:
-        res = np.searchsorted(a, v, side="right")
-        if res == a.shape[0]:
-            res = -1
     else:
-        indices = np.where(a > v)
-        if len(indices[0]):
-            res = indices[0][0]
-        else:
-            res = -1
-
-    if res == -1:
-        if raises:
-            raise ValueError(f"No values above {v} in the array")
-        else:
-            return missing
-    return res
+        res = _scan(a, _nonzero_mask, workers, max_temp_bytes, reverse)
 
-
-# ______________________________  first_nonzero ___________________________________
+    return _finalize(res, missing, raises, "All values in `a` are zeros.")
 
 
-def first_nonzero(a, missing=-1, raises=False):
+def first_nonzero(
+    a, missing=-1, raises=False, axis=None, workers=None, max_temp_bytes=None
+):
     """
     Returns the index of the first nonzero element in `a`.
 
     In 2D and above the the values in `a` are always tested and returned in
     row-major, C-style order.
 
+    If `axis` is given, each slice along `axis` is searched separately and
+    an int array of the first indices in each slice (`missing` for the slices
+    with no nonzero elements) is returned.
+
+    If `workers` is given, the array is scanned by that many threads
+    (-1 = one per CPU). Cannot be combined with `axis`.
+
+    `max_temp_bytes` limits the size of the temporary arrays per block
+    (see `find`).
+
     For example,
     >>> first_nonzero([0, 0, 7, 0, 5])
     2
@@ -268,23 +1471,935 @@ def first_nonzero(a, missing=-1, raises=False):
     1
     >>> first_nonzero([[0, 0, 0, 0], [0, 0, 5, 3]])
     (1, 2)
+    >>> first_nonzero([[0, 0, 0, 0], [0, 0, 5, 3]], axis=1)
+    array([-1,  2])
     """
-    a = np.asarray(a)
+    return _nonzero(a, missing, raises, axis, workers, max_temp_bytes, reverse=False)
+
+
+def last_nonzero(
+    a, missing=-1, raises=False, axis=None, workers=None, max_temp_bytes=None
+):
+    """
+    Returns the index of the last nonzero element in `a`.
+
+    Same as `first_nonzero` (the same parameters and restrictions), but the
+    array is scanned from the end.
+
+    For example,
+    >>> last_nonzero([0, 0, 7, 0, 5, 0])
+    4
+    >>> last_nonzero([[0, 0, 0, 0], [0, 5, 3, 0]], axis=1)
+    array([-1,  2])
+    """
+    return _nonzero(a, missing, raises, axis, workers, max_temp_bytes, reverse=True)
+
+
+def _nonzero_packed(
+    packed, count, bitorder, missing, raises, workers, max_temp_bytes, reverse
+):
+    """
+    Implementation of `first_nonzero_packed` (`reverse=False`) and
+    `last_nonzero_packed` (`reverse=True`).
+    """
+    packed = np.asarray(packed)
+    if packed.dtype != np.uint8:
+        raise ValueError(f"`packed` must be a uint8 array, got {packed.dtype}")
+    if packed.ndim != 1:
+        raise ValueError(
+            f"`packed` is expected to be 1-dimensional, got {packed.ndim}-dimensional array instead"
+        )
+    if bitorder not in ("big", "little"):
+        raise ValueError(f"`bitorder` must be 'big' or 'little', got {bitorder!r}")
+    nbits = packed.shape[0] * 8
+    if count is None:
+        count = nbits
+    elif count < 0:
+        raise ValueError("`count` must be non-negative")
+    full, rem = divmod(min(count, nbits), 8)
+
+    def in_bytes():
+        # the whole bytes: the zero ones are skipped, the hit one is unpacked
+        i = _scan(packed[:full], _nonzero_mask, workers, max_temp_bytes, reverse)
+        if i == -1:
+            return -1
+        bits = np.unpackbits(packed[i : i + 1], bitorder=bitorder)
+        return 8 * i + _first_in_block(bits, _nonzero_mask, reverse)
+
+    def in_last_byte():
+        # the bits of the last, partially used byte (the padding is ignored)
+        if rem == 0:
+            return -1
+        bits = np.unpackbits(packed[full : full + 1], count=rem, bitorder=bitorder)
+        i = _first_in_block(bits, _nonzero_mask, reverse)
+        return -1 if i == -1 else 8 * full + i
+
+    if reverse:
+        res = in_last_byte()
+        if res == -1:
+            res = in_bytes()
+    else:
+        res = in_bytes()
+        if res == -1:
+            res = in_last_byte()
+    return _finalize(res, missing, raises, "All bits in `packed` are zeros.")
+
+
+def first_nonzero_packed(
+    packed,
+    count=None,
+    bitorder="big",
+    missing=-1,
+    raises=False,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the first nonzero bit in a boolean mask packed
+    with `np.packbits` (i.e. `first_nonzero(np.unpackbits(packed, count=count,
+    bitorder=bitorder))`) without unpacking it.
+
+    The packed mask is 8 times smaller than a bool array, so are the memory
+    traffic and the temporaries of the scan. Only the byte with the hit is
+    unpacked.
+
+    `count` is the number of valid bits (the length of the original mask;
+    by default all the bits of `packed`); the bits after it are ignored.
+    `bitorder` is the one given to `np.packbits`.
+    The other parameters are the same as in `first_nonzero`.
+
+    For example,
+    >>> packed = np.packbits([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1])
+    >>> first_nonzero_packed(packed)
+    10
+    """
+    return _nonzero_packed(
+        packed, count, bitorder, missing, raises, workers, max_temp_bytes, False
+    )
+
+
+def last_nonzero_packed(
+    packed,
+    count=None,
+    bitorder="big",
+    missing=-1,
+    raises=False,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the last nonzero bit in a boolean mask packed
+    with `np.packbits`.
+
+    Same as `first_nonzero_packed` (the same parameters), but the packed
+    array is scanned from the end.
+
+    For example,
+    >>> last_nonzero_packed(np.packbits([0, 1, 0, 1, 0, 0, 0, 0, 0, 0]), count=10)
+    3
+    """
+    return _nonzero_packed(
+        packed, count, bitorder, missing, raises, workers, max_temp_bytes, True
+    )
+
+
+# ______________________________  first_where ___________________________________
 
-    if a.ndim != 1:
+
+def _bisect_where(a, test):
+    """
+    a 1D ndarray
+    test callable returning a boolean mask that is False, ..., False,
+        True, ..., True along `a` (e.g. `x > v` for a sorted `a`)
+
+    Returns the index of the first True or -1, evaluating `test` for
+    O(log n) single elements.
+    """
+    lo, hi = 0, a.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _first_in_block(a[mid : mid + 1], test) == 0:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo if lo < a.shape[0] else -1
+
+
+def _where(a, test, sorted_search, missing, raises, axis, workers, max_temp_bytes):
+    """
+    Common part of `first_where`, `first_below` and `first_between`:
+    `sorted_search` is the callable used for a 1D array with `sorted=True`
+    (None means no sorted mode).
+    Returns the raw result (-1 for 'not found').
+    """
+    sorted = sorted_search is not None
+    workers = _n_workers(workers, sorted, axis)
+    if axis is not None:
+        if sorted:
+            raise ValueError(
+                "`sorted=True` optimization cannot be combined with `axis`"
+            )
+        return _scan_axis(a, axis, test, max_temp_bytes)
+    elif a.ndim != 1:
         raise ValueError(
             f"`a` is expected to be 1-dimensional, got {a.ndim}-dimensional array instead"
         )
+    elif sorted:
+        return sorted_search(a)
+    else:
+        return _scan(a, test, workers, max_temp_bytes)
+
+
+def _check_comparable(a, *values):
+    """
+    Raises a ValueError for the types `first_above` and friends do not support.
+    """
+    if a.dtype.kind == "c" or any(isinstance(v, complex) for v in values):
+        raise ValueError("Complex numbers are not comparable.")
+    if a.dtype.kind == "b" or any(isinstance(v, bool) for v in values):
+        raise ValueError("`bool` type is not supported.")
+
+
+def first_where(
+    a,
+    predicate,
+    *args,
+    sorted=False,
+    missing=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the first element `x` of `a` for which
+    `predicate(x, *args)` is True.
+
+    `predicate` is a numpy ufunc (e.g. `np.less`, `np.isnan`) or any
+    vectorized callable that takes an array and returns a boolean array
+    of the same shape. It is applied to the array block by block, and the
+    search stops at the first block containing a match.
+
+    Parameters:
+    `a` : 1-D array_like
+    `predicate` : vectorized callable returning a boolean mask
+    `args` : additional arguments of `predicate`
+    `sorted` : the predicate is monotonic along `a` (False, ..., False, True, ...,
+        True, e.g. `np.greater` for a sorted `a`); find the first True by
+        bisection, evaluating the predicate for O(log n) elements only
+    `missing` : the value to return if there is no match
+    `raises` : if `True` raise an exception instead of returning `missing`
+    `axis`, `workers`, `max_temp_bytes` : same as in `first_above`
+
+    For example,
+    >>> first_where([4, 5, 8, 2, 7], np.less, 3)
+    3
+    >>> first_where([4, 5, 8, 2, 7], lambda x: x % 4 == 0)
+    0
+    >>> first_where([1, 3, 5, 7, 9], np.greater_equal, 5, sorted=True)
+    2
+    """
+    a = np.asarray(a)
+
+    def test(x):
+        return predicate(x, *args)
+
+    res = _where(
+        a,
+        test,
+        (lambda a: _bisect_where(a, test)) if sorted else None,
+        missing,
+        raises,
+        axis,
+        workers,
+        max_temp_bytes,
+    )
+    return _finalize(res, missing, raises, "No values satisfy the predicate")
+
+
+def first_below(
+    a,
+    v,
+    sorted=False,
+    missing=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the first element in `a` strictly less than `v`.
+    The parameters are the same as in `first_above`.
+
+    For example,
+    >>> first_below([4, 5, 8, 2, 7], 3)
+    3
+    >>> first_below([[4, 5, 8], [7, 2, 3]], 5, axis=1)
+    array([0, 1])
+    """
+    a = np.asarray(a)
+    _check_comparable(a, v)
+
+    def sorted_search(a):
+        return 0 if a.shape[0] and a[0] < v else -1
+
+    res = _where(
+        a,
+        lambda x: x < v,
+        sorted_search if sorted else None,
+        missing,
+        raises,
+        axis,
+        workers,
+        max_temp_bytes,
+    )
+    return _finalize(res, missing, raises, f"No values below {v} in the array")
+
+
+def first_between(
+    a,
+    lo,
+    hi,
+    sorted=False,
+    missing=-1,
+    raises=False,
+    axis=None,
+    workers=None,
+    max_temp_bytes=None,
+):
+    """
+    Returns the index of the first element `x` in `a` with `lo <= x < hi`.
+    The other parameters are the same as in `first_above`.
+
+    For example,
+    >>> first_between([4, 5, 8, 2, 7], 6, 8)
+    4
+    >>> first_between([1, 3, 5, 7, 9], 4, 8, sorted=True)
+    2
+    """
+    a = np.asarray(a)
+    _check_comparable(a, lo, hi)
+
+    def sorted_search(a):
+        i = np.searchsorted(a, lo, side="left")
+        return i if i < a.shape[0] and a[i] < hi else -1
+
+    res = _where(
+        a,
+        lambda x: (x >= lo) & (x < hi),
+        sorted_search if sorted else None,
+        missing,
+        raises,
+        axis,
+        workers,
+        max_temp_bytes,
+    )
+    return _finalize(
+        res, missing, raises, f"No values in the range [{lo}, {hi}) in the array"
+    )
+
+
+# ______________________________  .npy files ___________________________________
+
 
-    indices = np.nonzero(a)
-    if len(indices[0]):
-        res = indices[0][0]
+def find_in_file(path, v, **kwargs):
+    """
+    Same as `find(np.load(path), v, **kwargs)`, but the .npy file is
+    memory-mapped rather than loaded: the scan stops at the first hit, so
+    only the part of the file up to it is read from disk, and the file
+    can be larger than RAM. Use `max_temp_bytes` to limit the memory
+    taken by the temporary arrays.
+
+    For example,
+    >>> np.save("a.npy", np.arange(10**9))
+    >>> find_in_file("a.npy", 10, max_temp_bytes=2**20)
+    10
+    """
+    return find(np.load(path, mmap_mode="r"), v, **kwargs)
+
+
+def first_above_in_file(path, v, **kwargs):
+    """
+    Same as `first_above(np.load(path), v, **kwargs)` for a memory-mapped
+    .npy file (see `find_in_file`).
+    """
+    return first_above(np.load(path, mmap_mode="r"), v, **kwargs)
+
+
+def first_nonzero_in_file(path, **kwargs):
+    """
+    Same as `first_nonzero(np.load(path), **kwargs)` for a memory-mapped
+    .npy file (see `find_in_file`).
+    """
+    return first_nonzero(np.load(path, mmap_mode="r"), **kwargs)
+
+
+# ______________________________  streams ___________________________________
+
+
+def _search_stream(chunks, search):
+    """
+    chunks iterable of 1D array_likes: consecutive pieces of a 1D array
+    search callable that takes a chunk and returns the index of the first
+        hit in it or -1
+
+    Returns the index of the first hit counted from the beginning of the
+    stream or -1. The iterator is not consumed past the chunk with the hit.
+    """
+    offset = 0
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        if chunk.ndim != 1:
+            raise ValueError(
+                f"chunks are expected to be 1-dimensional, got {chunk.ndim}-dimensional array instead"
+            )
+        i = search(chunk)
+        if i != -1:
+            return offset + i
+        offset += chunk.shape[0]
+    return -1
+
+
+def find_in_stream(
+    chunks, v, rtol=1e-05, atol=1e-08, default=-1, raises=False, max_temp_bytes=None
+):
+    """
+    Returns the index of the first element equal to `v` in a 1D array
+    given as an iterable of consecutive chunks (e.g. a generator reading
+    them from a socket), without concatenating them. The chunks after the
+    one with the match are not requested from the iterable.
+
+    The comparison rules are the same as in `find`.
+
+    For example,
+    >>> find_in_stream(iter([[3, 1], [4, 1, 5], [9, 2]]), 5)
+    4
+    """
+    res = _search_stream(
+        chunks,
+        lambda chunk: find(
+            chunk, v, rtol=rtol, atol=atol, max_temp_bytes=max_temp_bytes
+        ),
+    )
+    return _finalize(res, default, raises, f"{v} is not in array")
+
+
+def first_above_in_stream(chunks, v, missing=-1, raises=False, max_temp_bytes=None):
+    """
+    Same as `first_above` for a 1D array given as an iterable of consecutive
+    chunks (see `find_in_stream`).
+    """
+    res = _search_stream(
+        chunks, lambda chunk: first_above(chunk, v, max_temp_bytes=max_temp_bytes)
+    )
+    return _finalize(res, missing, raises, f"No values above {v} in the array")
+
+
+def first_nonzero_in_stream(chunks, missing=-1, raises=False, max_temp_bytes=None):
+    """
+    Same as `first_nonzero` for a 1D array given as an iterable of consecutive
+    chunks (see `find_in_stream`).
+    """
+    res = _search_stream(
+        chunks, lambda chunk: first_nonzero(chunk, max_temp_bytes=max_temp_bytes)
+    )
+    return _finalize(res, missing, raises, "All values in `a` are zeros.")
+
+
+# ____________________________  sorted rows ________________________________
+
+
+def _searchsorted_rows(a, v, side="left"):
+    """
+    a 2D ndarray with each row sorted
+    v 1D ndarray, one value per row
+
+    Same as `[np.searchsorted(row, vi, side) for row, vi in zip(a, v)]`,
+    but all the rows are bisected simultaneously, so it takes
+    O(log n) vectorized steps instead of a python loop over the rows.
+    NaN and NaT are sorted to the end, just like in `np.searchsorted`.
+    """
+    m, n = a.shape
+    rows = np.arange(m)
+    lo = np.zeros(m, dtype=np.intp)
+    hi = np.full(m, n, dtype=np.intp)
+    nan_aware = a.dtype.kind in "fmM"
+    if nan_aware:
+        v_nan = np.isnan(v)
+    active = lo < hi
+    while active.any():
+        mid = (lo + hi) // 2
+        x = a[rows, np.minimum(mid, n - 1)]
+        if side == "left":
+            go_right = x < v
+            if nan_aware:
+                go_right |= v_nan & ~np.isnan(x)
+        else:
+            go_right = x <= v
+            if nan_aware:
+                go_right |= v_nan
+        go_right &= active
+        lo = np.where(go_right, mid + 1, lo)
+        hi = np.where(active & ~go_right, mid, hi)
+        active = lo < hi
+    return lo
+
+
+def _prepare_rows(a, v):
+    """
+    Validates the arguments of the `*_sorted_rows` functions and broadcasts
+    `v` to one value per row.
+    """
+    a = np.asarray(a)
+    if a.ndim != 2:
+        raise ValueError(
+            f"`a` is expected to be 2-dimensional, got {a.ndim}-dimensional array instead"
+        )
+    v = np.broadcast_to(np.asarray(v), a.shape[:1])
+    if np.issubdtype(a.dtype, np.complexfloating) or np.issubdtype(
+        v.dtype, np.complexfloating
+    ):
+        raise ValueError("Complex numbers are not comparable.")
+    return a, v
+
+
+def find_sorted_rows(a, v, rtol=1e-05, atol=1e-08, default=-1, raises=False):
+    """
+    Returns the index of the first element equal to `v[i]` in each row `a[i]`
+    of a 2D array `a` with each row sorted (in ascending order).
+    `v` is either a scalar or a 1D array with one value per row.
+
+    Gives the same results as `[find(row, vi, sorted=True) for row, vi in zip(a, v)]`
+    (including the `rtol`, `atol` window for the floating point comparison),
+    but all rows are bisected simultaneously.
+
+    The result is an int array of length `a.shape[0]` with `default` for the
+    rows with no match.
+
+    For example,
+    >>> find_sorted_rows([[1, 3, 5], [2, 4, 6]], [5, 5])
+    array([ 2, -1])
+    >>> find_sorted_rows([[1.1, 1.2, 1.3], [1.0, 1.1, 1.2]], 1.2)
+    array([1, 2])
+    """
+    a, v = _prepare_rows(a, v)
+    m, n = a.shape
+    if n == 0:
+        res = np.full(m, -1, dtype=np.intp)
+        return _finalize(res, default, raises, "Some of the values are not in array")
+    if np.issubdtype(a.dtype, np.floating) or (
+        np.issubdtype(a.dtype, np.number) and np.issubdtype(v.dtype, np.floating)
+    ):
+        delta = np.where(np.isfinite(v), atol + rtol * np.abs(v), 0)
+        i = _searchsorted_rows(a, v - delta)
+        x = a[np.arange(m), np.minimum(i, n - 1)]
+        found = (x >= v - delta) & (x <= v + delta)
     else:
-        res = -1
+        i = _searchsorted_rows(a, v)
+        x = a[np.arange(m), np.minimum(i, n - 1)]
+        found = x == v
+    if a.dtype.kind in "fmM":
+        found |= np.isnan(x) & np.isnan(v)
+    res = np.where(found & (i < n), i, -1)
+    return _finalize(res, default, raises, "Some of the values are not in array")
 
-    if res == -1:
-        if raises:
-            raise ValueError("All values in `a` are zeros.")
+
+def first_above_sorted_rows(a, v, missing=-1, raises=False):
+    """
+    Returns the index of the first element strictly greater than `v[i]`
+    in each row `a[i]` of a 2D array `a` with each row sorted (in ascending
+    order). `v` is either a scalar or a 1D array with one value per row.
+
+    Gives the same results as
+    `[first_above(row, vi, sorted=True) for row, vi in zip(a, v)]`,
+    but all rows are bisected simultaneously.
+
+    The result is an int array of length `a.shape[0]` with `missing` for the
+    rows with no values above the threshold.
+
+    For example,
+    >>> first_above_sorted_rows([[1, 3, 5], [2, 4, 6]], [2, 6])
+    array([ 1, -1])
+    """
+    a, v = _prepare_rows(a, v)
+    if np.issubdtype(a.dtype, bool) or np.issubdtype(v.dtype, bool):
+        raise ValueError("`bool` type is not supported.")
+    i = _searchsorted_rows(a, v, side="right")
+    res = np.where(i < a.shape[1], i, -1)
+    return _finalize(res, missing, raises, "Some of the rows have no values above `v`")
+
+
+# ______________________________  FindIndex ___________________________________
+
+
+class FindIndex:
+    """
+    Lookup structure for repeated searches in the same (static) array.
+
+    The array is sorted once (stable argsort, so that ties keep the
+    first-occurrence order) and then each `find`, `first_above`, `contains`
+    is a bisection: O(log n) instead of O(n) per call.
+
+    If `hashed=True`, a dict of first occurrences is also built, making exact
+    lookups O(1). It only works for exact dtypes (int, bool, string, bytes).
+
+    The rules for the floating point comparison (`rtol`, `atol`), NaN, inf,
+    NaT and complex numbers are the same as in `find`; object and complex
+    arrays cannot be sorted, so for them the methods fall back to a scan.
+
+    In 2D and above the indices are returned as tuples (C order), just like
+    in `find`.
+
+    For example,
+    >>> idx = FindIndex([3, 1, 4, 1, 5])
+    >>> idx.find(1)
+    1
+    >>> idx.first_above(3)
+    2
+    >>> idx.contains(9)
+    False
+    >>> idx.find_many([5, 3])
+    array([4, 0])
+    """
+
+    def __init__(self, a, hashed=False):
+        a = np.asarray(a)
+        self.shape = a.shape
+        self._flat = a.reshape(-1)
+        self._sortable = not (
+            a.dtype == object or np.issubdtype(a.dtype, np.complexfloating)
+        )
+        self._suffix_min = None
+        self._table = None
+        if self._sortable:
+            n = self._flat.shape[0]
+            order = np.argsort(self._flat, kind="stable")
+            self._sorted = self._flat[order]
+            self._order = np.append(order, n)
+            if a.dtype.kind in "fmM":  # NaN/NaT are sorted to the end
+                self._nvalid = n - np.count_nonzero(np.isnan(self._sorted))
+            else:
+                self._nvalid = n
+        if hashed:
+            if a.dtype.kind not in "biuUS":
+                raise ValueError(
+                    f"`hashed=True` only works for int, bool, string and bytes "
+                    f"arrays, got {a.dtype}"
+                )
+            keys, first = np.unique(self._flat, return_index=True)
+            self._table = dict(zip(keys.tolist(), first.tolist()))
+
+    def _unravel(self, i):
+        if len(self.shape) <= 1:
+            return i
+        return tuple(np.unravel_index(i, self.shape))
+
+    def _lookup(self, v, rtol, atol):
+        """
+        v 1D array of values
+        Returns the flat indices of the first matches and the mask of found values.
+        """
+        dtype = self._flat.dtype
+        if np.issubdtype(dtype, np.datetime64) and not np.issubdtype(
+            v.dtype, np.datetime64
+        ):
+            raise ValueError(
+                f"Incompatible data types of a ({dtype}) and v ({v.dtype})"
+            )
+        if (
+            not self._sortable
+            or v.dtype == object
+            or np.issubdtype(v.dtype, np.complexfloating)
+        ):
+            res = np.array(
+                [find(self._flat, vi, rtol=rtol, atol=atol) for vi in v],
+                dtype=np.intp,
+            )
+            return res, res != -1
+        if self._table is not None and v.dtype.kind in "biuUS":
+            res = np.array([self._table.get(vi, -1) for vi in v.tolist()], np.intp)
+            return res, res != -1
+        s = self._sorted
+        if np.issubdtype(dtype, np.floating) or (
+            np.issubdtype(dtype, np.number) and np.issubdtype(v.dtype, np.floating)
+        ):
+            delta = np.where(np.isfinite(v), atol + rtol * np.abs(v), 0)
+            lo = np.searchsorted(s, v - delta, side="left")
+            hi = np.searchsorted(s, v + delta, side="right")
+            res = _min_in_windows(self._order, lo, hi)
         else:
+            lo = np.searchsorted(s, v, side="left")
+            hi = np.searchsorted(s, v, side="right")
+            res = self._order[lo]  # stable sort => first occurrence
+        return res, hi > lo
+
+    def find(self, v, rtol=1e-05, atol=1e-08, default=-1, raises=False):
+        """
+        Same as `find(a, v, rtol, atol, default=default, raises=raises)`.
+        """
+        res, found = self._lookup(np.asarray(v).reshape(1), rtol, atol)
+        if not found[0]:
+            if raises:
+                raise ValueError(f"{v} is not in array")
+            return default
+        return self._unravel(res[0])
+
+    def contains(self, v, rtol=1e-05, atol=1e-08):
+        """
+        Returns True if `a` has an element equal to `v` (in the `find` sense).
+        """
+        return bool(self._lookup(np.asarray(v).reshape(1), rtol, atol)[1][0])
+
+    def find_many(self, values, rtol=1e-05, atol=1e-08, default=-1, raises=False):
+        """
+        Same as `find_many(a, values, rtol, atol, default=default, raises=raises)`.
+        """
+        values = np.asarray(values)
+        v = values.reshape(-1)
+        res, found = self._lookup(v, rtol, atol)
+        if not found.all():
+            if raises:
+                raise ValueError(f"{v[~found][0]} is not in array")
+            res[~found] = 0
+        if len(self.shape) > 1:
+            return tuple(
+                np.where(found, i, default).reshape(values.shape)
+                for i in np.unravel_index(res, self.shape)
+            )
+        return np.where(found, res, default).reshape(values.shape)
+
+    def first_above(self, v, missing=-1, raises=False):
+        """
+        Same as `first_above(a, v, missing=missing, raises=raises)`: like the
+        module-level `first_above`, only works for 1D arrays.
+        """
+        if len(self.shape) != 1:
+            raise ValueError(
+                f"`a` is expected to be 1-dimensional, got {len(self.shape)}-dimensional array instead"
+            )
+        dtype = self._flat.dtype
+        if np.issubdtype(dtype, complex) or isinstance(v, complex):
+            raise ValueError("Complex numbers are not comparable.")
+        if np.issubdtype(dtype, bool) or isinstance(v, bool):
+            raise ValueError("`bool` type is not supported.")
+        if not self._sortable:
+            res = first_above(self._flat, v)
+        else:
+            if self._suffix_min is None:
+                order = self._order[: self._nvalid]
+                self._suffix_min = np.append(
+                    np.minimum.accumulate(order[::-1])[::-1], -1
+                )
+            i = np.searchsorted(self._sorted[: self._nvalid], v, side="right")
+            res = self._suffix_min[i]
+        if res == -1:
+            if raises:
+                raise ValueError(f"No values above {v} in the array")
             return missing
-    return res
+        return self._unravel(res)
+
+
+# ______________________________  make_finder ___________________________________
+
+
+def _with_default(search, default, raises, message):
+    """
+    Wraps `search` returning -1 for 'not found' with the default/raises logic.
+    """
+
+    def finder(a, *args):
+        res = search(a, *args)
+        if res == -1:
+            if raises:
+                raise ValueError(message.format(*args))
+            return default
+        return res
+
+    return finder
+
+
+def _direct_search(a, test):
+    """
+    `_search` for the functions made by the `make_*` factories: a 1D `a`
+    that fits in the first block is tested in a single pass (one mask and
+    an argmax, no block generators), anything else goes through `_search`.
+    """
+    if a.ndim != 1 or not 0 < a.shape[0] <= _MIN_CHUNK:
+        return _search(a, test)
+    mask = _block_mask(a, test)
+    i = mask.argmax()
+    if mask[i]:
+        return i
+    return -1
+
+
+def make_finder(dtype, rtol=1e-05, atol=1e-08, sorted=False, default=-1, raises=False):
+    """
+    Returns a function `f(a, v)` equivalent to
+    `find(a, v, rtol=rtol, atol=atol, sorted=sorted, default=default, raises=raises)`
+    for arrays of the given `dtype`.
+
+    The dtype dispatch is done once when the finder is created and a 1D
+    array of up to `_MIN_CHUNK` elements is tested in a single pass, so a
+    call costs little more than the comparison itself. This matters for
+    small arrays searched in a loop. No input validation is done by `f`:
+    `a` must be an ndarray of the given dtype (1D if `sorted=True`).
+
+    For example,
+    >>> f = make_finder(float, rtol=1e-9)
+    >>> f(np.array([999980., 999990., 1e6]), 1e6)
+    2
+    """
+    dtype = np.dtype(dtype)
+    kind = dtype.kind
+
+    def generic(a, v):
+        return find(a, v, rtol=rtol, atol=atol, sorted=sorted)
+
+    if sorted:
+
+        def float_search(a, v):
+            return _float_find_sorted(a, v, rtol=rtol, atol=atol)
+
+        def exact_search(a, v):
+            return _generic_find(a, v, sorted=True)
+
+        def special_search(a, v):
+            return _generic_float_find(a, v, sorted=True)
+
+    else:
+
+        def float_search(a, v):
+            return _direct_search(a, lambda x: np.isclose(x, v, rtol=rtol, atol=atol))
+
+        def exact_search(a, v):
+            return _direct_search(a, lambda x: x == v)
+
+        def special_search(a, v):
+            return _direct_search(a, np.isnan if np.isnan(v) else lambda x: x == v)
+
+    if kind == "c":
+        if sorted:
+            raise ValueError(
+                "`sorted=True` optimization cannot be used with complex numbers"
+            )
+
+        def search(a, v):
+            v = complex(v)
+            if np.isfinite(v):
+                return float_search(a, v)
+            return special_search(a, v)
+
+    elif kind == "f":
+
+        def search(a, v):
+            if isinstance(v, complex):
+                return generic(a, v)
+            v = float(v)
+            if isfinite(v):
+                return float_search(a, v)
+            return special_search(a, v)
+
+    elif kind in "iu":
+
+        def search(a, v):
+            if isinstance(v, float):
+                if isfinite(v):
+                    return float_search(a, v)
+                return special_search(a, v)
+            elif isinstance(v, complex):
+                return generic(a, v)
+            return exact_search(a, v)
+
+    elif kind == "M":
+
+        def search(a, v):
+            if not isinstance(v, np.datetime64):
+                raise ValueError(
+                    f"Incompatible data types of a ({a.dtype}) and v ({type(v)})"
+                )
+            if np.isnat(v):
+                return special_search(a, v)
+            return exact_search(a, v)
+
+    elif kind in "bUS":
+
+        def search(a, v):
+            if isinstance(v, (float, complex, np.datetime64)):
+                return generic(a, v)
+            return exact_search(a, v)
+
+    else:
+        search = generic
+
+    return _with_default(search, default, raises, "{} is not in array")
+
+
+def make_first_above(dtype, sorted=False, missing=-1, raises=False):
+    """
+    Returns a function `f(a, v)` equivalent to
+    `first_above(a, v, sorted=sorted, missing=missing, raises=raises)`
+    for 1D arrays of the given `dtype` with the dtype checks done once.
+
+    For example,
+    >>> f = make_first_above(int, sorted=True)
+    >>> f(np.array([1, 3, 4, 7, 9]), 5)
+    3
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == "c":
+        raise ValueError("Complex numbers are not comparable.")
+    if dtype.kind == "b":
+        raise ValueError("`bool` type is not supported.")
+
+    if sorted and dtype.kind in "fmM":  # NaNs (NaTs) are sorted to the end
+        nan = dtype.type("NaT" if dtype.kind in "mM" else "nan")
+
+        def search(a, v):
+            end = np.searchsorted(a, nan)
+            res = np.searchsorted(a[:end], v, side="right")
+            return -1 if res == end else res
+
+    elif sorted:
+
+        def search(a, v):
+            res = np.searchsorted(a, v, side="right")
+            return -1 if res == a.shape[0] else res
+
+    else:
+
+        def search(a, v):
+            return _direct_search(a, lambda x: x > v)
+
+    return _with_default(search, missing, raises, "No values above {} in the array")
+
+
+def make_first_nonzero(dtype, missing=-1, raises=False):
+    """
+    Returns a function `f(a)` equivalent to
+    `first_nonzero(a, missing=missing, raises=raises)`
+    for 1D arrays of the given `dtype` with the dtype checks done once.
+
+    For example,
+    >>> f = make_first_nonzero(bool)
+    >>> f(np.array([False, True, False, False, True]))
+    1
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == "b":
+
+        def search(a):
+            return _direct_search(a, lambda x: x)
+
+    elif dtype.kind in "US":
+        zero = dtype.type()
+
+        def search(a):
+            return _direct_search(a, lambda x: x != zero)
+
+    else:
+
+        def search(a):
+            return _direct_search(a, lambda x: x.astype(bool))
+
+    return _with_default(search, missing, raises, "All values in `a` are zeros.")
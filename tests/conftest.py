@@ -0,0 +1,10 @@
+import pytest
+
+from npi import pyfind
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Tiny scan blocks so that short test arrays span many of them."""
+    monkeypatch.setattr(pyfind, "_MIN_CHUNK", 3)
+    monkeypatch.setattr(pyfind, "_MAX_CHUNK", 8)
@@ -40,5 +40,17 @@ def test3a():
     assert nanargmax(a) == (1, 0)
 
 
+def test_max_temp_bytes():
+    rng = np.random.default_rng(4)
+    for _ in range(20):
+        a = rng.integers(0, 50, size=(30, 40)).astype(float)
+        a[rng.random(a.shape) < 0.3] = nan
+        assert nanargmin(a, max_temp_bytes=64) == nanargmin(a)
+        assert nanargmax(a, max_temp_bytes=64) == nanargmax(a)
+        assert nanargmin(a[0], max_temp_bytes=64) == np.nanargmin(a[0])
+    with pytest.raises(ValueError):
+        nanargmin([nan, nan, nan], max_temp_bytes=64)
+
+
 if __name__ == "__main__":
     pytest.main(["-s", __file__])  # + '::test7'])
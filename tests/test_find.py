@@ -4,6 +4,7 @@ from itertools import permutations, product
 from decimal import Decimal as D
 
 from npi import find
+from npi import pyfind
 
 
 def test0():
@@ -226,6 +227,11 @@ def test_mixed_types():
     with pytest.raises(ValueError):
         find(a, np.nan, sorted=True)
 
+    a = np.array([[1, 2], [np.nan, 3]], dtype=object)
+    assert pyfind.find(a, np.nan) == (1, 0)
+    a = np.array([D(1), np.datetime64("nat"), "x"], dtype=object)
+    assert pyfind.find(a, np.nan) == 1
+
 
 def test_signed_unsigned():
     assert find(np.array([2**62], np.int64), np.uint64(2**62)) == 0
@@ -240,11 +246,137 @@ def test_sorted_ndarray():
         find([[1, 2], [3, 4]], 3, sorted=True)
 
 
+def test_chunked(small_chunks):
+    a = np.arange(100)
+    for i in (0, 2, 3, 4, 10, 11, 50, 99):
+        assert pyfind.find(a, i) == i
+        assert pyfind.find(a.astype(float), i + 1e-9) == i
+    assert pyfind.find(a, 100) == -1
+    assert pyfind.find(a.reshape(10, 10), 57) == (5, 7)
+    b = np.zeros(100)
+    b[40] = np.nan
+    assert pyfind.find(b, np.nan) == 40
+
+
+def test_large():
+    a = np.zeros(10**7, dtype=np.int8)
+    a[-1] = 1
+    assert find(a, 1) == 10**7 - 1
+    assert find(a, 2) == -1
+
+
 def test_raises():
     with pytest.raises(ValueError):
         find([1, 2, 3], 4, raises=True)
 
 
+def test_axis(small_chunks):
+    a = np.array([[3, 8, 4], [5, 2, 7]])
+    assert np.array_equal(pyfind.find(a, 4, axis=1), [2, -1])
+    assert np.array_equal(pyfind.find(a, 4, axis=0), [-1, -1, 0])
+    assert np.array_equal(pyfind.find(a, 4, axis=-1, default=9), [2, 9])
+    assert np.array_equal(pyfind.find(a * 1.0, 4.000000001, axis=1), [2, -1])
+    b = np.array([[1.0, np.nan], [np.nan, 2.0]])
+    assert np.array_equal(pyfind.find(b, np.nan, axis=1), [1, 0])
+    assert np.array_equal(pyfind.find(b.astype(object), np.nan, axis=1), [1, 0])
+    with pytest.raises(ValueError):
+        pyfind.find(a, 4, axis=1, raises=True)
+    with pytest.raises(ValueError):
+        pyfind.find([1, 2, 3], 2, axis=0, sorted=True)
+
+    c = np.zeros((4, 5, 60), dtype=int)
+    c[1, 2, 7] = c[3, 0, 59] = c[0, 4, 0] = 1
+    expected = np.full((4, 5), -1)
+    expected[1, 2], expected[3, 0], expected[0, 4] = 7, 59, 0
+    assert np.array_equal(pyfind.find(c, 1, axis=2), expected)
+    assert pyfind.find(c, 1, axis=1).shape == (4, 60)
+
+
+def test_workers(small_chunks):
+    a = np.arange(200) % 50
+    for workers in (2, 4, -1):
+        for v in (0, 1, 7, 8, 30, 49):
+            assert pyfind.find(a, v, workers=workers) == v
+            assert pyfind.find(a * 1.0, v + 1e-9, workers=workers) == v
+        assert pyfind.find(a, 50, workers=workers) == -1
+        assert pyfind.find(a, 50, workers=workers, default=None) is None
+        assert pyfind.find(a.reshape(20, 10), 37, workers=workers) == (3, 7)
+
+
+def test_workers_errors(small_chunks):
+    a = np.arange(100)
+    with pytest.raises(ValueError):
+        pyfind.find(a, 1, workers=0)
+    with pytest.raises(ValueError):
+        pyfind.find(a, 1, sorted=True, workers=0)
+    with pytest.raises(TypeError):
+        pyfind.find(a, 1, workers=2.5)
+    with pytest.raises(ValueError):
+        pyfind.find(a, 1, sorted=True, workers=2)
+    with pytest.raises(ValueError):
+        pyfind.find(a, 1, axis=0, workers=2)
+
+    def test(block):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        pyfind._scan(a, test, workers=4)
+
+
+def test_layout(small_chunks):
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 30, size=(6, 7, 5))
+    views = [
+        np.asfortranarray(base),
+        base.transpose(2, 0, 1),
+        base[::2, 1:, ::-1],
+        np.asfortranarray(base)[1:, :, 2],
+        np.asfortranarray(base[:, :2, :1]),
+    ]
+    for a in views:
+        offsets = []
+        for offset, block in pyfind._blocks(a, 8, False):
+            assert np.shares_memory(block, a)
+            assert np.array_equal(
+                block.ravel(), a.ravel()[offset : offset + block.size]
+            )
+            offsets.append(offset)
+        assert offsets == sorted(offsets)
+        for v in range(31):
+            hits = np.argwhere(a == v)
+            expected = tuple(hits[0]) if hits.shape[0] else -1
+            assert pyfind.find(a, v) == expected
+            assert pyfind.find(a * 1.0, v + 1e-9) == expected
+            assert pyfind.find(a, v, workers=3) == expected
+            last = tuple(hits[-1]) if hits.shape[0] else -1
+            assert pyfind.find_last(a, v) == last
+            assert pyfind.find_last(a, v, workers=3) == last
+            assert [tuple(h) for h in hits] == list(pyfind.finditer(a, v))
+
+
+def test_axis_1d():
+    assert pyfind.find([1, 2, 3], 2, axis=0) == 1
+    assert not isinstance(pyfind.find([1, 2, 3], 2, axis=0), np.ndarray)
+    assert pyfind.find([1, 2, 3], 7, axis=0, default=None) is None
+    with pytest.raises(ValueError, match="axis"):
+        pyfind.find([1, 2, 3], 2, axis=0, sorted=True)
+
+
+def test_object_nan():
+    a = np.array([D(1), D("NaN"), "x", None, np.nan, np.datetime64("nat")], object)
+    assert pyfind.find(a, np.nan) == 4
+    assert pyfind.find(a[:4], np.nan) == -1
+    assert pyfind.find(a.reshape(3, 2), np.nan) == (2, 0)
+    assert np.array_equal(pyfind.find(a.reshape(2, 3), np.nan, axis=1), [-1, 1])
+
+    class Weird:
+        def __ne__(self, other):
+            raise TypeError("not comparable")
+
+    b = np.array([Weird(), 1.0, np.nan], object)
+    assert pyfind.find(b, np.nan) == 2
+
+
 if __name__ == "__main__":
     #    test_special_complex()
     pytest.main(["-s", "-x", __file__])  # + '::test7'])
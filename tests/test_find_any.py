@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from decimal import Decimal as D
+
+from npi import find_any
+from npi import pyfind
+
+
+def reference(a, values):
+    hits = [pyfind.find(a, v) for v in values]
+    hits = [h for h in hits if h != -1]
+    return min(hits) if hits else -1
+
+
+def test_basic():
+    assert find_any([3, 1, 4, 1, 5], [5, 4]) == 2
+    assert find_any([3, 1, 4, 1, 5], [7, 9]) == -1
+    assert find_any([3, 1, 4, 1, 5], []) == -1
+    assert find_any([3, 1, 4, 1, 5], [7], default=None) is None
+    assert find_any([[3, 8, 4], [5, 2, 7]], [7, 2]) == (1, 1)
+    assert np.array_equal(find_any([[3, 8, 4], [5, 2, 7]], [4, 5], axis=1), [2, 0])
+    assert find_any(np.array(["a", "bb", "ccc"]), ["ccc", "bb"]) == 1
+    with pytest.raises(ValueError):
+        find_any([1, 2, 3], [4], raises=True)
+
+
+def test_float():
+    a = np.array([0.0, 1.1, 2.0, np.inf, np.nan, 999990.0])
+    assert find_any(a, [1.1000000001, 7.0]) == 1
+    assert find_any(a, [np.nan, np.inf]) == 3
+    assert find_any(a, [np.nan]) == 4
+    assert find_any(a, [1e6]) == 5
+    assert find_any(a, [1e6], rtol=1e-9) == -1
+    assert find_any([1, 2, 3], [2.0000000001]) == 1
+    assert find_any([1.0, 2.0, 3.0], [3]) == 2
+
+
+def test_other_datatypes():
+    d = np.array(["2023-01-20", "nat", "2023-01-22"], dtype="M8[D]")
+    assert find_any(d, np.array(["2023-01-22", "2023-01-25"], dtype="M8[D]")) == 2
+    assert find_any(d, np.array(["nat"], dtype="M8[D]")) == 1
+    with pytest.raises(ValueError):
+        find_any(d, [1, 2])
+    assert find_any(np.array([D(1), D(2), np.nan], object), [np.nan, D(2)]) == 1
+    assert find_any([1 + 1j, 2 + 2j], [2 + 2j]) == 1
+
+
+def test_random(small_chunks):
+    rng = np.random.default_rng(2)
+    for _ in range(100):
+        a = rng.integers(-50, 50, size=rng.integers(0, 60))
+        values = rng.integers(-60, 60, size=rng.integers(0, 10))
+        assert pyfind.find_any(a, values) == reference(a, values)
+        af = a * 0.37
+        vf = values * 0.37 + rng.normal(0, 1e-7, values.shape)
+        rtol = rng.choice([1e-5, 1e-2, 0.5])
+        assert pyfind.find_any(af, vf, rtol=rtol) == min(
+            [h for h in [pyfind.find(af, v, rtol=rtol) for v in vf] if h != -1],
+            default=-1,
+        )
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+from decimal import Decimal as D
+
+from npi import find, first_above, FindIndex
+
+
+def test0():
+    idx = FindIndex([3, 1, 4, 1, 5])
+    assert idx.find(1) == 1
+    assert idx.find(7) == -1
+    assert idx.find(7, default=None) is None
+    assert idx.contains(5)
+    assert not idx.contains(9)
+    assert idx.first_above(3) == 2
+    assert idx.first_above(5) == -1
+    assert np.array_equal(idx.find_many([5, 3]), [4, 0])
+    with pytest.raises(ValueError):
+        idx.find(7, raises=True)
+    with pytest.raises(ValueError):
+        idx.first_above(5, raises=True)
+
+
+def test_ndarray():
+    idx = FindIndex([[3, 8, 4], [5, 2, 7]])
+    assert idx.find(7) == (1, 2)
+    assert idx.find(9) == -1
+    with pytest.raises(ValueError):
+        idx.first_above(7)
+
+
+def test_same_as_find():
+    rng = np.random.default_rng(0)
+    a = np.round(rng.random(300) * 10, 1)
+    a[::17] = np.nan
+    idx = FindIndex(a)
+    for v in list(a[:30]) + [0.05, 11.0, np.nan, np.inf]:
+        assert idx.find(v) == find(a, v), v
+        assert idx.find(v, rtol=0.05) == find(a, v, rtol=0.05), v
+        assert idx.first_above(v) == first_above(a, v), v
+
+
+def test_hashed():
+    a = np.array([3, 1, 4, 1, 5])
+    idx = FindIndex(a, hashed=True)
+    assert idx.find(1) == 1
+    assert idx.find(np.int8(4)) == 2
+    assert idx.find(1.0) == 1
+    assert idx.find(7) == -1
+    assert np.array_equal(idx.find_many([5, 3, 7]), [4, 0, -1])
+    idx = FindIndex(np.array(["a", "bb", "ccc", "bb"]), hashed=True)
+    assert idx.find("bb") == 1
+    with pytest.raises(ValueError):
+        FindIndex([1.0, 2.0], hashed=True)
+
+
+def test_other_datatypes():
+    a = np.arange(np.datetime64("2023-01-20"), np.datetime64("2023-01-23"))
+    a = np.hstack([a, np.datetime64("nat"), a])
+    idx = FindIndex(a)
+    assert idx.find(np.datetime64("2023-01-22")) == 2
+    assert idx.find(np.datetime64("nat")) == 3
+    assert idx.first_above(np.datetime64("2023-01-21")) == 2
+    assert idx.first_above(np.datetime64("2023-01-22")) == -1
+    with pytest.raises(ValueError):
+        idx.find(22)
+
+    idx = FindIndex(np.array([D(1), D(2), D(3), np.nan]))
+    assert idx.find(D(2)) == 1
+    assert idx.find(np.nan) == 3
+    assert FindIndex(np.array([D(1), D(2), D(3)])).first_above(D(1)) == 1
+
+    idx = FindIndex(np.array([1 + 1j, 2 + 2j, 3 + 3j]))
+    assert idx.find(2 + 2j) == 1
+    with pytest.raises(ValueError):
+        idx.first_above(1)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
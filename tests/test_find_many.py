@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from decimal import Decimal as D
+
+from npi import find, find_many
+
+
+def test0():
+    assert np.array_equal(find_many([3, 1, 4, 1, 5], [1, 5, 9]), [1, 4, -1])
+    assert np.array_equal(find_many([1.1, 1.2, 1.3], [1.3, 1.2]), [2, 1])
+    assert np.array_equal(find_many(np.arange(0, 1, 0.1), [0.3, 0.35]), [3, -1])
+    i, j = find_many([[3, 8, 4], [5, 2, 7]], [7, 3, 9])
+    assert np.array_equal(i, [1, 0, -1])
+    assert np.array_equal(j, [2, 0, -1])
+
+
+def test_same_as_find():
+    rng = np.random.default_rng(0)
+    for a in (
+        rng.integers(0, 50, 200),
+        rng.integers(0, 50, 200).astype(float),
+        rng.integers(0, 50, 200).astype(np.uint8),
+        np.round(rng.random(200), 2),
+    ):
+        values = np.concatenate([a[:20], a[:20] + 0.5, [-1, 1000]])
+        assert np.array_equal(
+            find_many(a, values), [find(a, v) for v in values]
+        ), a.dtype
+        assert np.array_equal(
+            find_many(a, values, rtol=0.1), [find(a, v, rtol=0.1) for v in values]
+        ), a.dtype
+
+
+def test_tolerance_window():
+    # the element closest in value is not the first one within tolerance
+    a = np.array([1.0 + 1e-9, 0.5, 1.0, 1.0 - 1e-9])
+    assert np.array_equal(find_many(a, [1.0]), [0])
+    assert np.array_equal(find_many(a, [1.0], rtol=0, atol=0), [2])
+
+
+def test_special_floats():
+    a = np.array([0.0, 2.0, np.nan, np.inf, np.inf, np.NINF, np.nan, np.NZERO])
+    values = [0.0, np.nan, np.inf, np.NINF, 3.0]
+    assert np.array_equal(find_many(a, values), [0, 2, 3, 5, -1])
+
+
+def test_other_datatypes():
+    assert np.array_equal(
+        find_many(np.array(["a", "bb", "ccc"]), ["ccc", "d"]), [2, -1]
+    )
+    a = np.arange(np.datetime64("2023-01-20"), np.datetime64("2023-01-23"))
+    a = np.append(a, np.datetime64("nat"))
+    assert np.array_equal(
+        find_many(a, np.array(["2023-01-22", "nat"], dtype="M8[D]")), [2, 3]
+    )
+    with pytest.raises(ValueError):
+        find_many(a, [22])
+    assert np.array_equal(
+        find_many(np.array([D(1), D(2), D(3)]), [D(3), D(5)]), [2, -1]
+    )
+    assert np.array_equal(find_many([1 + 1j, 2 + 2j], [2 + 2j]), [1])
+
+
+def test_default_raises():
+    assert list(find_many([1, 2, 3], [3, 4], default=None)) == [2, None]
+    with pytest.raises(ValueError):
+        find_many([1, 2, 3], [3, 4], raises=True)
+    assert find_many([1, 2, 3], []).shape == (0,)
+    assert np.array_equal(find_many([], [1]), [-1])
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
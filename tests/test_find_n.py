@@ -0,0 +1,47 @@
+import pytest
+import numpy as np
+from decimal import Decimal as D
+
+from npi import find_n, finditer
+from npi import pyfind
+
+
+def test_find_n():
+    a = [3, 1, 4, 1, 5, 1]
+    assert np.array_equal(find_n(a, 1, 2), [1, 3])
+    assert np.array_equal(find_n(a, 1, 10), [1, 3, 5])
+    assert np.array_equal(find_n(a, 1, 0), [])
+    assert np.array_equal(find_n(a, 7, 2), [])
+    assert np.array_equal(find_n([1.1, 1.2, 1.2000001, 1.3], 1.2, 5), [1, 2])
+    assert np.array_equal(find_n([1.0, np.nan, np.nan], np.nan, 5), [1, 2])
+    assert np.array_equal(find_n(np.array([D(1), np.nan, 3], object), np.nan, 5), [1])
+    i, j = find_n([[3, 1, 4], [1, 5, 1]], 1, 2)
+    assert np.array_equal(i, [0, 1]) and np.array_equal(j, [1, 0])
+
+
+def test_finditer():
+    assert list(finditer([3, 1, 4, 1, 5, 1], 1)) == [1, 3, 5]
+    assert list(finditer([3, 1, 4], 7)) == []
+    assert list(finditer([[3, 1, 4], [1, 5, 1]], 1)) == [(0, 1), (1, 0), (1, 2)]
+
+
+def test_lazy(small_chunks):
+    seen = []
+
+    def test(block):
+        seen.append(block.size)
+        return block % 10 == 0
+
+    a = np.arange(100)
+    hits = pyfind._scan_hits(a, test)
+    assert next(hits).tolist() == [0]
+    assert sum(seen) == 3
+    for v in (0, 7):
+        expected = np.flatnonzero(a % 10 == v)
+        for k in (1, 3, 10, 20):
+            assert np.array_equal(pyfind.find_n(a % 10, v, k), expected[:k])
+        assert list(pyfind.finditer(a % 10, v)) == expected.tolist()
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
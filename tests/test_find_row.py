@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+
+from npi import find_row, find_rows
+
+
+def reference(a, row):
+    hits = np.flatnonzero((a == row).all(axis=1))
+    return hits[0] if hits.shape[0] else -1
+
+
+def test_find_row():
+    a = [[1, 2], [3, 4], [3, 4]]
+    assert find_row(a, [3, 4]) == 1
+    assert find_row(a, [4, 3]) == -1
+    assert find_row(a, [3.0, 4.0]) == 1
+    assert find_row(a, [3.5, 4]) == -1
+    assert find_row(a, [4, 3], default=None) is None
+    with pytest.raises(ValueError):
+        find_row(a, [4, 3], raises=True)
+    assert find_row([["ab", "c"], ["a", "bc"]], ["a", "bc"]) == 1
+    assert find_row([[1.0, -0.0], [np.nan, 1.0]], [1.0, 0.0]) == 0
+    assert find_row([[1.0, -0.0], [np.nan, 1.0]], [np.nan, 1.0]) == -1
+    assert find_row(np.zeros((3, 0)), []) == 0
+    assert find_row(np.zeros((0, 2)), [0, 0]) == -1
+    assert find_row(np.zeros((0, 2), int), [1, 2]) == -1
+    for hashed in (False, True):
+        res = find_rows(np.zeros((0, 2), int), [[1, 2], [0, 0]], hashed=hashed)
+        assert np.array_equal(res, [-1, -1])
+        res = find_rows(np.zeros((0, 2)), [[1.0, 2.0]], hashed=hashed, default=9)
+        assert np.array_equal(res, [9])
+
+
+def test_layouts(small_chunks):
+    rng = np.random.default_rng(5)
+    t = rng.integers(0, 3, size=(100, 3))
+    for a in (
+        t,
+        np.asfortranarray(t),
+        t[::2],
+        t[:, ::-1],
+        t.astype(float),
+        t.astype("U1"),
+    ):
+        for row in a[::7]:
+            assert find_row(a, row) == reference(a, row)
+            assert find_row(a, row, max_temp_bytes=64) == reference(a, row)
+        assert find_row(a, np.full(3, 7).astype(a.dtype)) == -1
+
+
+def test_sorted():
+    rng = np.random.default_rng(6)
+    t = rng.integers(0, 4, size=(60, 3))
+    a = t[np.lexsort(t.T[::-1])]
+    for row in np.array(np.meshgrid(*[range(5)] * 3)).reshape(3, -1).T:
+        assert find_row(a, row, sorted=True) == reference(a, row)
+
+
+def test_find_rows():
+    a = [[1, 2], [3, 4], [3, 4]]
+    q = [[3, 4], [5, 6], [1, 2], [1.5, 2]]
+    for hashed in (False, True):
+        assert np.array_equal(find_rows(a, q, hashed=hashed), [1, -1, 0, -1])
+        assert np.array_equal(find_rows(a, q, hashed=hashed, default=9), [1, 9, 0, 9])
+        with pytest.raises(ValueError):
+            find_rows(a, q, hashed=hashed, raises=True)
+    f = [[1.0, -0.0], [np.nan, 1.0], [2.0, 1.0]]
+    assert np.array_equal(find_rows(f, [[1.0, 0.0], [np.nan, 1.0], [2, 1]]), [0, -1, 2])
+    d = np.array([["2023-01-01", "NaT"], ["2023-01-01", "2023-01-02"]], "M8[D]")
+    assert np.array_equal(find_rows(d, d), [-1, 1])
+    rng = np.random.default_rng(7)
+    t = rng.integers(0, 3, size=(50, 3))
+    q = rng.integers(0, 4, size=(40, 3))
+    expected = [reference(t, row) for row in q]
+    assert np.array_equal(find_rows(t, q), expected)
+    assert np.array_equal(
+        find_rows(t.astype("S1"), q.astype("S1"), hashed=True), expected
+    )
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        find_row([1, 2, 3], [1])
+    with pytest.raises(ValueError):
+        find_row([[1, 2]], [1, 2, 3])
+    with pytest.raises(ValueError):
+        find_row([[1, 2]], [[1, 2]])
+    with pytest.raises(ValueError):
+        find_rows([[1, 2]], [1, 2])
+    with pytest.raises(ValueError):
+        find_row([[1, 2]], ["a", "b"])
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -4,6 +4,7 @@ from itertools import permutations, product
 from decimal import Decimal as D
 
 from npi import first_above
+from npi import pyfind
 
 
 def test0():
@@ -153,11 +154,41 @@ def test_mixed():
             assert first_above(np.array([2, 3, 5], dtype=t1), t2(-1)) == 0
 
 
+def test_chunked(small_chunks):
+    a = np.arange(100)
+    for i in (0, 2, 3, 4, 10, 11, 50, 98):
+        assert pyfind.first_above(a, i) == i + 1
+    assert pyfind.first_above(a, 99) == -1
+
+
 def test_ndarray():
     with pytest.raises(ValueError):
         first_above([[1, 2], [3, 4]], 5)
 
 
+def test_axis():
+    a = np.array([[4, 5, 8], [2, 7, 3]])
+    assert np.array_equal(pyfind.first_above(a, 6, axis=1), [2, 1])
+    assert np.array_equal(pyfind.first_above(a, 6, axis=0), [-1, 1, 0])
+    assert np.array_equal(pyfind.first_above(a, 9, axis=1, missing=None), [None, None])
+    with pytest.raises(ValueError):
+        pyfind.first_above(a, 9, axis=1, raises=True)
+    with pytest.raises(ValueError):
+        pyfind.first_above(a, 6, axis=1, sorted=True)
+
+
+def test_workers(small_chunks):
+    a = np.arange(200)
+    for workers in (3, -1):
+        for i in (0, 5, 50, 150, 198):
+            assert pyfind.first_above(a, i, workers=workers) == i + 1
+        assert pyfind.first_above(a, 199, workers=workers) == -1
+    with pytest.raises(ValueError):
+        pyfind.first_above(a, 1, workers=0)
+    with pytest.raises(ValueError):
+        pyfind.first_above(a, 1, sorted=True, workers=3)
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-x", __file__])  # + '::test7'])
     # pytest.main(["-s", __file__])  # + '::test7'])
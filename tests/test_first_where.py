@@ -0,0 +1,71 @@
+import pytest
+import numpy as np
+
+from npi import first_where, first_below, first_between
+from npi import pyfind
+
+
+def test_first_where():
+    a = [4, 5, 8, 2, 7]
+    assert first_where(a, np.less, 3) == 3
+    assert first_where(a, lambda x: x % 4 == 0) == 0
+    assert first_where(a, np.greater, 9) == -1
+    assert first_where(a, np.greater, 9, missing=None) is None
+    assert first_where([1.0, np.nan, 2.0], np.isnan) == 1
+    assert np.array_equal(
+        first_where([[4, 5, 8], [7, 2, 3]], np.less, 4, axis=1), [-1, 1]
+    )
+    with pytest.raises(ValueError):
+        first_where(a, np.greater, 9, raises=True)
+    with pytest.raises(ValueError):
+        first_where([[1, 2], [3, 4]], np.greater, 1)
+
+
+def test_first_where_sorted():
+    a = np.array([1, 3, 5, 7, 9])
+    for v in range(11):
+        expected = pyfind.first_where(a, np.greater_equal, v)
+        assert first_where(a, np.greater_equal, v, sorted=True) == expected
+    assert first_where(a[:0], np.greater, 1, sorted=True) == -1
+    with pytest.raises(ValueError):
+        first_where(a, np.greater, 1, sorted=True, axis=0)
+
+
+def test_first_below():
+    a = [4, 5, 8, 2, 7]
+    assert first_below(a, 3) == 3
+    assert first_below(a, 1) == -1
+    assert first_below(a, 4.5) == 0
+    assert first_below([1, 2, 3], 2, sorted=True) == 0
+    assert first_below([1, 2, 3], 1, sorted=True) == -1
+    assert np.array_equal(first_below([[4, 5, 8], [7, 2, 3]], 5, axis=1), [0, 1])
+    with pytest.raises(ValueError):
+        first_below([1j], 2)
+    with pytest.raises(ValueError):
+        first_below([True], 2)
+
+
+def test_first_between():
+    a = [4, 5, 8, 2, 7]
+    assert first_between(a, 6, 8) == 4
+    assert first_between(a, 8, 9) == 2
+    assert first_between(a, 5, 5) == -1
+    b = [1, 3, 5, 7, 9]
+    for lo in range(11):
+        for hi in range(lo, 12):
+            expected = first_between(b, lo, hi)
+            assert first_between(b, lo, hi, sorted=True) == expected, (lo, hi)
+    with pytest.raises(ValueError):
+        first_between(a, 10, 12, raises=True)
+
+
+def test_chunked(small_chunks):
+    a = np.arange(100)[::-1]
+    for i in (0, 2, 3, 4, 10, 50, 99):
+        assert pyfind.first_below(a, 100 - i) == i
+        assert pyfind.first_where(a, np.less, 100 - i, workers=3) == i
+        assert pyfind.first_between(a, 99 - i, 100 - i) == i
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
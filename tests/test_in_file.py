@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+
+from npi import find_in_file, first_above_in_file, first_nonzero_in_file
+from npi import pyfind
+
+
+def test_find_in_file(tmp_path):
+    path = tmp_path / "a.npy"
+    np.save(path, np.arange(100000) * 0.5)
+    assert find_in_file(path, 10.0) == 20
+    assert find_in_file(path, 10.0, max_temp_bytes=1000) == 20
+    assert find_in_file(path, 49999.5, max_temp_bytes=1000) == 99999
+    assert find_in_file(path, -1.0) == -1
+    assert first_above_in_file(path, 100.0, max_temp_bytes=1000) == 201
+    assert first_above_in_file(path, 100.0, sorted=True) == 201
+    assert first_nonzero_in_file(path, max_temp_bytes=1000) == 1
+
+
+def test_memmap_2d(tmp_path):
+    path = tmp_path / "b.npy"
+    a = np.zeros((300, 70), dtype=np.int16)
+    a[123, 45] = a[200, 3] = 7
+    np.save(path, a)
+    m = np.load(path, mmap_mode="r")
+    assert pyfind.find(m, 7, max_temp_bytes=512) == (123, 45)
+    assert find_in_file(path, 7, axis=0)[3] == 200
+
+
+def test_block_sizes():
+    sizes = []
+
+    def test(block):
+        sizes.append(block.size)
+        return np.zeros(block.shape, dtype=bool)
+
+    a = np.zeros(100000)
+    assert pyfind._scan(a, test, max_temp_bytes=3200) == -1
+    assert sum(sizes) == a.size
+    assert max(sizes) == 3200 // (pyfind._TEMP_FACTOR * 8)
+
+    sizes.clear()
+    pyfind._scan_axis(a.reshape(100, 1000), 1, test, max_temp_bytes=32000)
+    assert max(sizes) <= 32000 // (pyfind._TEMP_FACTOR * 8)
+
+
+def test_max_temp_bytes_errors():
+    with pytest.raises(ValueError):
+        pyfind.find([1, 2, 3], 2, max_temp_bytes=0)
+    with pytest.raises(TypeError):
+        pyfind.first_nonzero([1, 2, 3], max_temp_bytes=1.5)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
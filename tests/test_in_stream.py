@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+
+from npi import find_in_stream, first_above_in_stream, first_nonzero_in_stream
+
+
+def test_find():
+    chunks = [[3, 1], [4, 1, 5], [9, 2]]
+    assert find_in_stream(chunks, 5) == 4
+    assert find_in_stream(chunks, 3) == 0
+    assert find_in_stream(chunks, 2) == 6
+    assert find_in_stream(chunks, 7) == -1
+    assert find_in_stream(chunks, 7, default=None) is None
+    assert find_in_stream([[1.1, 1.2], [1.3]], 1.3) == 2
+    assert find_in_stream([[1.0, 2.0], [np.nan]], np.nan) == 2
+    assert find_in_stream([], 1) == -1
+    with pytest.raises(ValueError):
+        find_in_stream(chunks, 7, raises=True)
+    with pytest.raises(ValueError):
+        find_in_stream([[[1, 2]]], 1)
+
+
+def test_stops_early():
+    consumed = []
+
+    def gen():
+        for i in range(10):
+            consumed.append(i)
+            yield np.arange(i * 10, i * 10 + 10)
+
+    assert find_in_stream(gen(), 35) == 35
+    assert consumed == [0, 1, 2, 3]
+
+
+def test_first_above():
+    chunks = [np.array([1, 2]), np.array([]), np.array([3, 7, 2])]
+    assert first_above_in_stream(chunks, 2) == 2
+    assert first_above_in_stream(iter(chunks), 9) == -1
+    with pytest.raises(ValueError):
+        first_above_in_stream(chunks, 9, raises=True)
+
+
+def test_first_nonzero():
+    chunks = [np.zeros(5), np.zeros(3), np.array([0.0, 0.0, 1.0])]
+    assert first_nonzero_in_stream(chunks) == 10
+    assert first_nonzero_in_stream(chunks[:2], missing=None) is None
+    assert first_nonzero_in_stream([[False], [False, True]]) == 2
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -0,0 +1,105 @@
+import pytest
+import numpy as np
+from decimal import Decimal as D
+
+from npi import find_last, last_above, last_nonzero
+from npi import pyfind
+
+
+def test_find_last():
+    assert find_last([3, 1, 4, 1, 5], 1) == 3
+    assert find_last([3, 1, 4, 1, 5], 7) == -1
+    assert find_last([3, 1, 4, 1, 5], 7, default=None) is None
+    assert find_last([1.1, 1.2, 1.2000001, 1.3], 1.2) == 2
+    assert find_last([[3, 8, 4], [5, 2, 4]], 4) == (1, 2)
+    assert find_last([1.0, np.nan, 2.0, np.nan, 3.0], np.nan) == 3
+    assert find_last([1.0, np.inf, np.inf, 3.0], np.inf) == 2
+    assert find_last(np.array([D(1), np.nan, D(1), np.nan, 5], object), np.nan) == 3
+    assert find_last(np.array(["a", "b", "a", "c"]), "a") == 2
+    with pytest.raises(ValueError):
+        find_last([1, 2, 3], 4, raises=True)
+
+
+def test_find_last_sorted():
+    a = [1, 2, 2, 2, 3]
+    assert find_last(a, 2, sorted=True) == 3
+    assert find_last(a, 0, sorted=True) == -1
+    assert find_last(a, 4, sorted=True) == -1
+    assert find_last(a, 3.0, sorted=True) == 4
+    b = [1.0, 2.0, 2.000001, 3.0, np.inf, np.inf, np.nan, np.nan]
+    assert find_last(b, 2.0, sorted=True) == 2
+    assert find_last(b, 2.5, sorted=True) == -1
+    assert find_last(b, np.inf, sorted=True) == 5
+    assert find_last(b, np.nan, sorted=True) == 7
+    assert find_last(b[:4], np.nan, sorted=True) == -1
+
+
+def test_find_last_axis():
+    a = np.array([[3, 8, 4], [4, 2, 7]])
+    assert np.array_equal(find_last(a, 4, axis=1), [2, 0])
+    assert np.array_equal(find_last(a, 4, axis=0), [1, -1, 0])
+
+
+def test_last_above_sorted_nan():
+    a = np.array([1.0, 2.0, 3.0, np.nan])
+    assert pyfind.last_above(a, 1.0, sorted=True) == 2
+    assert pyfind.last_above(a, 1.0) == 2
+    assert pyfind.last_above(a, 3.0, sorted=True) == -1
+    assert pyfind.first_above(a, 3.0, sorted=True) == -1
+    assert pyfind.first_above(a, 1.0, sorted=True) == 1
+    assert pyfind.last_above(np.array([np.nan, np.nan]), 0.0, sorted=True) == -1
+    d = np.array(["2023-01-01", "2023-01-02", "NaT"], "M8[D]")
+    assert pyfind.last_above(d, np.datetime64("2023-01-01"), sorted=True) == 1
+    assert pyfind.last_above(d, np.datetime64("2023-01-02"), sorted=True) == -1
+    assert pyfind.first_above(d, np.datetime64("2023-01-02"), sorted=True) == -1
+
+
+def test_random(small_chunks):
+    rng = np.random.default_rng(1)
+    for _ in range(50):
+        a = rng.integers(0, 30, size=rng.integers(0, 100))
+        for v in (0, 5, 29):
+            hits = np.flatnonzero(a == v)
+            expected = hits[-1] if hits.size else -1
+            assert pyfind.find_last(a, v) == expected
+            assert pyfind.find_last(a, v, workers=3) == expected
+            assert pyfind.find_last(a.astype(float), v + 1e-9) == expected
+            hits = np.flatnonzero(a > v)
+            expected = hits[-1] if hits.size else -1
+            assert pyfind.last_above(a, v) == expected
+            assert pyfind.last_above(np.sort(a), v, sorted=True) == (
+                a.size - 1 if hits.size else -1
+            )
+        hits = np.flatnonzero(a % 7)
+        expected = hits[-1] if hits.size else -1
+        assert pyfind.last_nonzero(a % 7) == expected
+        assert pyfind.last_nonzero(a % 7, workers=2) == expected
+    b = rng.integers(0, 3, size=(20, 30))
+    expected = [np.flatnonzero(row)[-1] if row.any() else -1 for row in b]
+    assert np.array_equal(pyfind.last_nonzero(b, axis=1), expected)
+
+
+def test_last_above():
+    assert last_above([4, 5, 8, 2, 7], 6) == 4
+    assert last_above([4, 5, 8, 2, 7], 9) == -1
+    assert last_above([4, 5, 8, 2, 7], 9, missing=None) is None
+    assert np.array_equal(last_above([[4, 5, 8], [7, 2, 3]], 6, axis=1), [2, 0])
+    with pytest.raises(ValueError):
+        last_above([1j], 2)
+    with pytest.raises(ValueError):
+        last_above([[1, 2], [3, 4]], 1)
+    with pytest.raises(ValueError):
+        last_above([1, 2], 3, raises=True)
+
+
+def test_last_nonzero():
+    assert last_nonzero([0, 0, 7, 0, 5, 0]) == 4
+    assert last_nonzero([False, True, False]) == 1
+    assert last_nonzero([0, 0]) == -1
+    assert np.array_equal(last_nonzero([[0, 0, 0], [0, 5, 0]], axis=1), [-1, 1])
+    with pytest.raises(ValueError):
+        last_nonzero([0, 0], raises=True)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -0,0 +1,111 @@
+import pytest
+import numpy as np
+from decimal import Decimal as D
+
+from npi import find, first_above, first_nonzero
+from npi import make_finder, make_first_above, make_first_nonzero
+
+
+def test_finder():
+    cases = [
+        (np.array([3, 1, 4, 1, 5]), [4, 7, 4.0, 4.000000001, np.nan, 2j]),
+        (np.array([1.1, 1.2, 1.3, np.nan, np.inf]), [1.2, 7, np.nan, np.inf, 1.2 + 0j]),
+        (np.array([1 + 1j, 2 + 2j, np.nan]), [2 + 2j, 2, np.nan]),
+        (np.array([False, True]), [True, False, 1]),
+        (np.array(["a", "bb", "ccc"]), ["bb", "d"]),
+        (np.array([D(1), D(2), D(3), np.nan]), [D(2), 2.0, np.nan]),
+        (
+            np.array(["2023-01-20", "nat", "2023-01-22"], dtype="M8[D]"),
+            [np.datetime64("2023-01-22"), np.datetime64("nat")],
+        ),
+    ]
+    for a, values in cases:
+        f = make_finder(a.dtype)
+        for v in values:
+            assert f(a, v) == find(a, v), (a, v)
+        f = make_finder(a.dtype, default=None)
+        assert f(a[:0], values[0]) is None
+
+
+def test_finder_sorted():
+    a = np.array([1.0, 3.0, 4.0, 7.0, 9.0])
+    f = make_finder(a.dtype, sorted=True)
+    assert f(a, 4) == 2
+    assert f(a, 5) == -1
+    f = make_finder(int, sorted=True, raises=True)
+    assert f(a.astype(int), 4.0) == 2
+    with pytest.raises(ValueError):
+        f(a.astype(int), 5)
+    with pytest.raises(ValueError):
+        make_finder(complex, sorted=True)
+
+
+def test_finder_ndarray():
+    f = make_finder(int)
+    assert f(np.array([[3, 8, 4], [5, 2, 7]]), 7) == (1, 2)
+
+
+def test_finder_datetime():
+    f = make_finder("M8[D]")
+    with pytest.raises(ValueError):
+        f(np.array(["2023-01-20"], dtype="M8[D]"), 22)
+
+
+def test_first_above():
+    a = np.array([1, 2, 3, 3, 3, 4])
+    f = make_first_above(a.dtype)
+    g = make_first_above(a.dtype, sorted=True, missing=None)
+    for v in range(6):
+        assert f(a, v) == first_above(a, v)
+        assert g(a, v) == first_above(a, v, sorted=True, missing=None)
+    with pytest.raises(ValueError):
+        make_first_above(complex)
+    with pytest.raises(ValueError):
+        make_first_above(bool)
+    with pytest.raises(ValueError):
+        make_first_above(int, raises=True)(a, 4)
+
+
+def test_first_nonzero():
+    for a in (
+        np.array([0, 0, 1, 0, 3]),
+        np.array([0.0, 0.0, 1.0]),
+        np.array([False, False, True]),
+        np.array(["", "", "a"]),
+        np.array([D(0), D(0), D(1)]),
+        np.array([0, 0]),
+    ):
+        f = make_first_nonzero(a.dtype)
+        assert f(a) == first_nonzero(a), a
+    with pytest.raises(ValueError):
+        make_first_nonzero(int, raises=True)(np.array([0, 0]))
+
+
+def test_first_above_sorted_nan():
+    a = np.array([1.0, 3.0, 4.0, np.nan, np.nan])
+    f = make_first_above(a.dtype, sorted=True)
+    for v in (0, 3, 4, 5):
+        assert f(a, v) == first_above(a, v, sorted=True), v
+    a = np.array(["2023-01-20", "2023-01-22", "nat"], dtype="M8[D]")
+    f = make_first_above(a.dtype, sorted=True)
+    assert f(a, np.datetime64("2023-01-21")) == 1
+    assert f(a, np.datetime64("2023-01-22")) == -1
+
+
+def test_chunked(small_chunks):
+    rng = np.random.default_rng(4)
+    for n in (0, 1, 3, 4, 100):
+        a = rng.integers(0, 20, n)
+        b = a * 0.5
+        f, g = make_finder(a.dtype), make_finder(b.dtype)
+        for v in (0, 7, 19, 25, 7.0, np.nan):
+            assert f(a, v) == find(a, v), (n, v)
+            assert g(b, v) == find(b, v), (n, v)
+        f, g = make_first_above(a.dtype), make_first_nonzero(a.dtype)
+        for v in (0, 10, 19):
+            assert f(a, v) == first_above(a, v), (n, v)
+        assert g(a) == first_nonzero(a), n
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+
+from npi import set_max_temp_bytes, nanargmin
+from npi import pyfind
+
+
+def test_default(monkeypatch):
+    monkeypatch.setattr(pyfind, "_default_max_temp_bytes", None)
+    sizes = []
+
+    def test(block):
+        sizes.append(block.size)
+        return np.zeros(block.shape, dtype=bool)
+
+    a = np.zeros(100000)
+    assert set_max_temp_bytes(3200) is None
+    try:
+        pyfind._scan(a, test)
+        assert max(sizes) == 3200 // (pyfind._TEMP_FACTOR * 8)
+        sizes.clear()
+        pyfind._scan(a, test, max_temp_bytes=6400)  # per-call value wins
+        assert max(sizes) == 6400 // (pyfind._TEMP_FACTOR * 8)
+        b = np.arange(1000.0)
+        b[:10] = np.nan
+        assert nanargmin(b[::-1]) == 989
+        assert pyfind.find(b, 500.0) == 500
+    finally:
+        assert set_max_temp_bytes(None) == 3200
+    sizes.clear()
+    pyfind._scan(a, test)
+    assert max(sizes) > 6400 // (pyfind._TEMP_FACTOR * 8)  # no budget
+
+
+def test_errors(monkeypatch):
+    monkeypatch.setattr(pyfind, "_default_max_temp_bytes", None)
+    with pytest.raises(ValueError):
+        set_max_temp_bytes(0)
+    with pytest.raises(TypeError):
+        set_max_temp_bytes("1GB")
+    assert pyfind._default_max_temp_bytes is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
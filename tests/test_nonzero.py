@@ -4,6 +4,7 @@ from itertools import permutations, product
 from decimal import Decimal as D
 
 from npi import first_nonzero
+from npi import pyfind
 
 NUMERICS = [
     np.int8,
@@ -40,11 +41,48 @@ def test_missing():
         first_nonzero([0, 0, 0], raises=True)
 
 
+def test_chunked(small_chunks):
+    for i in (0, 2, 3, 4, 10, 11, 50, 99):
+        a = np.zeros(100)
+        a[i] = 1
+        assert pyfind.first_nonzero(a) == i
+        assert pyfind.first_nonzero(a.astype(bool)) == i
+    assert pyfind.first_nonzero(np.zeros(100)) == -1
+
+
 def test_raises():
     with pytest.raises(ValueError):
         first_nonzero([[1, 2], [3, 4]])
 
 
+def test_axis():
+    a = np.array([[0, 0, 0, 0], [0, 0, 5, 3]])
+    assert np.array_equal(pyfind.first_nonzero(a, axis=1), [-1, 2])
+    assert np.array_equal(pyfind.first_nonzero(a, axis=0), [-1, -1, 1, 1])
+    assert np.array_equal(pyfind.first_nonzero(a.astype(bool), axis=1), [-1, 2])
+    assert np.array_equal(pyfind.first_nonzero(a, axis=1, missing=4), [4, 2])
+    with pytest.raises(ValueError):
+        pyfind.first_nonzero(a, axis=1, raises=True)
+
+
+def test_workers(small_chunks):
+    for i in (0, 9, 100, 199):
+        a = np.zeros(200)
+        a[[i, 199]] = 1
+        assert pyfind.first_nonzero(a, workers=4) == i
+        assert pyfind.first_nonzero(a, workers=-1) == i
+    assert pyfind.first_nonzero(np.zeros(200), workers=4) == -1
+    with pytest.raises(ValueError):
+        pyfind.first_nonzero(np.zeros((2, 2)), axis=1, workers=4)
+    with pytest.raises(TypeError):
+        pyfind.first_nonzero(np.zeros(10), workers="2")
+
+
+def test_axis_1d():
+    assert pyfind.first_nonzero([0, 0, 3], axis=0) == 2
+    assert pyfind.first_nonzero([0, 0, 0], axis=-1, missing=None) is None
+
+
 if __name__ == "__main__":
     pytest.main(["-s", "-x", __file__])  # + '::test7'])
     # pytest.main(["-s", __file__])  # + '::test7'])
@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+
+from npi import first_nonzero_packed, last_nonzero_packed
+
+
+def test_packed():
+    packed = np.packbits([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1])
+    assert first_nonzero_packed(packed) == 10
+    assert last_nonzero_packed(packed) == 12
+    assert first_nonzero_packed(np.zeros(3, np.uint8)) == -1
+    assert last_nonzero_packed(np.zeros(3, np.uint8), missing=None) is None
+    assert first_nonzero_packed(np.array([], np.uint8)) == -1
+    with pytest.raises(ValueError):
+        first_nonzero_packed(np.zeros(3, np.uint8), raises=True)
+
+
+def test_count():
+    packed = np.packbits([0, 0, 0, 1, 1, 1, 1, 1], bitorder="little")
+    assert first_nonzero_packed(packed, bitorder="little") == 3
+    assert first_nonzero_packed(packed, count=3, bitorder="little") == -1
+    assert last_nonzero_packed(packed, count=5, bitorder="little") == 4
+    assert last_nonzero_packed(packed, count=100, bitorder="little") == 7
+
+
+def test_random(small_chunks):
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        n = rng.integers(0, 150)
+        mask = rng.random(n) < rng.choice([0.0, 0.01, 0.1])
+        hits = np.flatnonzero(mask)
+        for bitorder in ("big", "little"):
+            packed = np.packbits(mask, bitorder=bitorder)
+            first = hits[0] if hits.shape[0] else -1
+            last = hits[-1] if hits.shape[0] else -1
+            kw = dict(count=n, bitorder=bitorder)
+            assert first_nonzero_packed(packed, **kw) == first
+            assert last_nonzero_packed(packed, **kw) == last
+            assert first_nonzero_packed(packed, workers=2, **kw) == first
+            assert last_nonzero_packed(packed, max_temp_bytes=64, **kw) == last
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        first_nonzero_packed(np.zeros(3, bool))
+    with pytest.raises(ValueError):
+        first_nonzero_packed(np.zeros((3, 2), np.uint8))
+    with pytest.raises(ValueError):
+        first_nonzero_packed(np.zeros(3, np.uint8), bitorder="middle")
+    with pytest.raises(ValueError):
+        first_nonzero_packed(np.zeros(3, np.uint8), count=-1)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
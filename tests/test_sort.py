@@ -2,8 +2,12 @@ import pytest
 import numpy as np
 from itertools import permutations, product
 import pandas as pd
+from numpy.lib.recfunctions import (
+    unstructured_to_structured as u2s,
+    structured_to_unstructured as s2u,
+)
 
-from npi import sort
+from npi import sort, argsort, nsmallest, nlargest
 
 
 def test0():
@@ -226,6 +230,141 @@ def test4():
     )
 
 
+def structured_sort(a, by=None):
+    s = u2s(np.array(a))
+    if by is not None:
+        by = [f"f{c}" for c in by]
+    s.sort(order=by)
+    return s2u(s)
+
+
+def test_lexsort_engine():
+    rng = np.random.default_rng(8)
+    for n_values in (2, 30, 1000, 10**6):
+        a = rng.integers(0, n_values, size=(300, 4))
+        for by in (None, [0], [2, 0], [3, 1, 2]):
+            assert np.array_equal(sort(a, by), structured_sort(a, by))
+        f = a / 7
+        f[rng.random(f.shape) < 0.1] = np.nan
+        for by in (None, [1], [2, 0]):
+            assert np.array_equal(sort(f, by), structured_sort(f, by), equal_nan=True)
+    c = rng.integers(0, 3, size=(5, 40, 3))
+    assert np.array_equal(sort(c, [1]), np.array([structured_sort(m, [1]) for m in c]))
+    assert sort(np.zeros((3, 0))).shape == (3, 0)
+    assert np.array_equal(sort([[2, 1], [1, 2]], by=-1), [[2, 1], [1, 2]])
+    with pytest.raises(ValueError):
+        sort([[2, 1], [1, 2]], by=2)
+
+
+def test_descending_dtypes():
+    rng = np.random.default_rng(9)
+    base = rng.integers(0, 4, size=(50, 3))
+    tables = [
+        base.astype(np.uint8),
+        base.astype(bool),
+        base.astype(np.int64) + np.iinfo(np.int64).min,
+        (base * 7).astype("U2"),
+        base.astype("M8[D]"),
+        np.where(base == 3, np.nan, base / 3),
+    ]
+    for a in tables:
+        copy = a.copy()
+        df = pd.DataFrame({c: a[:, c] for c in range(3)})
+        for by, asc in (
+            ([0], False),
+            ([1, 0], [False, True]),
+            ([2, 1, 0], [True, False, False]),
+        ):
+            x = sort(a, by, ascending=asc)
+            full_asc = (
+                [asc] * 3 if isinstance(asc, bool) else asc + [True] * (3 - len(asc))
+            )
+            cols = by + [c for c in range(3) if c not in by]
+            y = df.sort_values(cols, ascending=full_asc, kind="stable").values
+            assert np.array_equal(x.astype(str), y.astype(a.dtype).astype(str)), (
+                a.dtype,
+                by,
+                asc,
+            )
+        assert np.array_equal(a, copy, equal_nan=a.dtype.kind == "f")
+
+
+def test_descending_1d():
+    assert np.array_equal(
+        sort(np.array([0, 255, 7], np.uint8), ascending=False), [255, 7, 0]
+    )
+    assert np.array_equal(
+        sort([True, False, True], ascending=False), [True, True, False]
+    )
+    assert np.array_equal(sort(["b", "a", "c"], ascending=False), ["c", "b", "a"])
+    imin = np.iinfo(np.int64).min
+    assert np.array_equal(sort(np.array([imin, 0, 5]), ascending=False), [5, 0, imin])
+    x = sort([1.0, np.nan, 3.0], ascending=False)
+    assert np.array_equal(x, [3.0, 1.0, np.nan], equal_nan=True)
+    d = np.array(["2023-01-02", "NaT", "2023-01-03"], "M8[D]")
+    assert np.array_equal(
+        sort(d, ascending=False).astype(str), ["2023-01-03", "2023-01-02", "NaT"]
+    )
+    assert np.array_equal(
+        sort([[1, 2], [3, 4]], [0], ascending=[np.False_]), [[3, 4], [1, 2]]
+    )
+
+
+def test_argsort():
+    rng = np.random.default_rng(10)
+    a = rng.integers(0, 3, size=(60, 3))
+    for by, asc in ((None, True), ([1], False), ([2, 0], [False, True])):
+        order = argsort(a, by, ascending=asc)
+        assert np.array_equal(a[order], sort(a, by, ascending=asc))
+        keys = a[order][:, 0] * 9 + a[order][:, 1] * 3 + a[order][:, 2]
+        for i in range(len(order) - 1):  # stable: identical rows keep their order
+            if keys[i] == keys[i + 1]:
+                assert order[i] < order[i + 1]
+    assert np.array_equal(argsort([3, 1, 2]), [1, 2, 0])
+    assert np.array_equal(argsort([3, 1, 3], ascending=False), [0, 2, 1])
+    c = rng.integers(0, 3, size=(4, 10, 2))
+    order = argsort(c, [1])
+    assert order.shape == (4, 10)
+    assert np.array_equal(
+        np.take_along_axis(c, order[..., None], axis=-2), sort(c, [1])
+    )
+    assert np.array_equal(argsort(np.zeros((3, 0))), [0, 1, 2])
+    with pytest.raises(ValueError):
+        argsort(np.int32(10))
+
+
+def test_top_k():
+    rng = np.random.default_rng(11)
+    base = rng.integers(0, 5, size=(80, 3))
+    f = base / 3
+    f[rng.random(f.shape) < 0.2] = np.nan
+    d = base.astype("M8[D]")
+    d[base == 4] = np.datetime64("NaT")
+    for a in (base, base.astype(np.uint8), f, d, base.astype("U1")):
+        for by in (None, [1], [2, 0]):
+            for k in (0, 1, 5, 30, 79, 80, 100):
+                x = nsmallest(a, k, by)
+                assert np.array_equal(x.astype(str), sort(a, by)[:k].astype(str))
+                x = nlargest(a, k, by)
+                y = sort(a, by, ascending=False)[:k]
+                assert np.array_equal(x.astype(str), y.astype(str))
+        assert np.array_equal(
+            nsmallest(a[:, 0], 7).astype(str), sort(a[:, 0])[:7].astype(str)
+        )
+        assert np.array_equal(
+            nlargest(a[:, 0], 7).astype(str),
+            sort(a[:, 0], ascending=False)[:7].astype(str),
+        )
+    assert np.array_equal(nlargest([5, 1, 7, 3], 2), [7, 5])
+    assert nsmallest(np.zeros((3, 0)), 2).shape == (2, 0)
+    with pytest.raises(ValueError):
+        nsmallest([1, 2], -1)
+    with pytest.raises(ValueError):
+        nsmallest([1, 2], 1.5)
+    with pytest.raises(ValueError):
+        nsmallest(np.zeros((2, 2, 2)), 1)
+
+
 def test_0d():
     assert np.array_equal(sort(np.int32(10)), np.int32(10))
 
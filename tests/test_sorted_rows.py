@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+
+from npi import find_sorted_rows, first_above_sorted_rows
+from npi import pyfind
+
+
+def test_find():
+    a = np.array([[1, 3, 5], [2, 4, 6]])
+    assert np.array_equal(find_sorted_rows(a, [5, 5]), [2, -1])
+    assert np.array_equal(find_sorted_rows(a, 4), [-1, 1])
+    assert np.array_equal(find_sorted_rows(a, [1, 6], default=9), [0, 2])
+    assert np.array_equal(find_sorted_rows(a, [0, 7], default=9), [9, 9])
+    with pytest.raises(ValueError):
+        find_sorted_rows(a, 4, raises=True)
+
+
+def test_find_float():
+    a = np.array([[999980.0, 999990.0, 1e6], [1.0, 2.0, 3.0]])
+    assert np.array_equal(find_sorted_rows(a, [1e6, 2]), [1, 1])
+    assert np.array_equal(find_sorted_rows(a, [1e6, 2], rtol=1e-9), [2, 1])
+    b = np.array([[1.0, 2.0, np.inf, np.nan], [-np.inf, 0.0, np.nan, np.nan]])
+    assert np.array_equal(find_sorted_rows(b, [np.nan, np.nan]), [3, 2])
+    assert np.array_equal(find_sorted_rows(b, [np.inf, -np.inf]), [2, 0])
+    assert np.array_equal(find_sorted_rows(b, [np.inf, np.inf]), [2, -1])
+
+
+def test_other_datatypes():
+    a = np.array([["a", "bb", "ccc"], ["b", "c", "d"]])
+    assert np.array_equal(find_sorted_rows(a, ["bb", "d"]), [1, 2])
+    assert np.array_equal(first_above_sorted_rows(a, "bb"), [2, 1])
+    d = np.array([["2023-01-20", "2023-01-21", "nat"]], dtype="M8[D]")
+    assert np.array_equal(find_sorted_rows(d, np.datetime64("2023-01-21")), [1])
+    assert np.array_equal(find_sorted_rows(d, np.datetime64("nat")), [2])
+
+
+def test_random():
+    rng = np.random.default_rng(0)
+    for dtype in (np.int64, np.float64):
+        a = np.sort(rng.integers(0, 20, size=(50, 17)).astype(dtype), axis=1)
+        v = rng.integers(-1, 21, size=50).astype(dtype)
+        expected = [pyfind.find(row, vi, sorted=True) for row, vi in zip(a, v)]
+        assert np.array_equal(find_sorted_rows(a, v), expected)
+        expected = [pyfind.first_above(row, vi, sorted=True) for row, vi in zip(a, v)]
+        assert np.array_equal(first_above_sorted_rows(a, v), expected)
+
+
+def test_first_above():
+    a = np.array([[1, 3, 5], [2, 4, 6]])
+    assert np.array_equal(first_above_sorted_rows(a, [2, 6]), [1, -1])
+    assert np.array_equal(first_above_sorted_rows(a, 0), [0, 0])
+    assert np.array_equal(first_above_sorted_rows(a, [2.5, 3.5]), [1, 1])
+    assert np.array_equal(first_above_sorted_rows(a, 9, missing=None), [None, None])
+    with pytest.raises(ValueError):
+        first_above_sorted_rows(a, 9, raises=True)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        find_sorted_rows([1, 2, 3], 2)
+    with pytest.raises(ValueError):
+        find_sorted_rows([[1, 2], [3, 4]], [1, 2, 3])
+    with pytest.raises(ValueError):
+        first_above_sorted_rows([[1j]], 2)
+    with pytest.raises(ValueError):
+        first_above_sorted_rows([[True]], 2)
+
+
+def test_empty():
+    assert np.array_equal(find_sorted_rows(np.zeros((3, 0)), 1.0), [-1, -1, -1])
+    assert np.array_equal(first_above_sorted_rows(np.zeros((3, 0)), 1.0), [-1, -1, -1])
+    assert find_sorted_rows(np.zeros((0, 3)), 1.0).shape == (0,)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+
+from npi import find, find_last
+
+
+def reference(a, v, reverse=False):
+    hits = np.argwhere(np.char.startswith(a, v))
+    if not hits.shape[0]:
+        return -1
+    hit = hits[-1] if reverse else hits[0]
+    return int(hit[0]) if a.ndim == 1 else tuple(hit)
+
+
+def test_startswith():
+    a = ["ab12", "cd34", "cd56", "c"]
+    assert find(a, "cd", startswith=True) == 1
+    assert find_last(a, "cd", startswith=True) == 2
+    assert find(a, "c", startswith=True) == 1
+    assert find(a, "cd34", startswith=True) == 1
+    assert find(a, "cd345", startswith=True) == -1
+    assert find(a, "x", startswith=True) == -1
+    assert find(a, "", startswith=True) == 0
+    assert find_last(a, "", startswith=True) == 3
+    assert find(a, "c\0", startswith=True) == 1
+    assert find(a, "x", startswith=True, default=None) is None
+    with pytest.raises(ValueError):
+        find(a, "x", startswith=True, raises=True)
+    b = np.array([b"ab12", b"cd34", b"cd56"])
+    assert find(b, b"cd", startswith=True) == 1
+    assert find_last(b, b"cd", startswith=True) == 2
+    c = np.array([["ab", "cd"], ["ce", "cd"]])
+    assert find(c, "c", startswith=True) == (0, 1)
+    assert np.array_equal(find(c, "c", startswith=True, axis=0), [1, 0])
+    assert find(np.array(["ab", "cd"], dtype=">U2"), "c", startswith=True) == 1
+
+
+def test_sorted():
+    a = np.array(["a", "ab", "abc", "abd", "b", "ba"])
+    for v in ("a", "ab", "abc", "b", "bb", "c", ""):
+        for reverse in (False, True):
+            search = find_last if reverse else find
+            assert search(a, v, startswith=True, sorted=True) == reference(
+                a, v, reverse
+            )
+
+
+def test_random(small_chunks):
+    rng = np.random.default_rng(2)
+    words = np.array(["".join(w) for w in rng.choice(list("abc"), size=(200, 4))])
+    for a in (words, words.reshape(10, 20), words.reshape(20, 10).T):
+        for v in ("a", "ab", "abc", "cccc", "ccccc"):
+            assert find(a, v, startswith=True) == reference(a, v)
+            assert find_last(a, v, startswith=True) == reference(a, v, True)
+            assert find(a, v, startswith=True, workers=2) == reference(a, v)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        find([1, 2, 3], 1, startswith=True)
+    with pytest.raises(ValueError):
+        find(["ab", "cd"], b"c", startswith=True)
+    with pytest.raises(ValueError):
+        find(np.array([b"ab", b"cd"]), "c", startswith=True)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
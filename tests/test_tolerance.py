@@ -0,0 +1,87 @@
+import datetime
+
+import pytest
+import numpy as np
+
+from npi import find, find_last
+
+t0 = np.datetime64("2024-01-01T00:00:00.000")
+ms = np.timedelta64(1, "ms")
+
+
+def test_tolerance():
+    a = t0 + np.array([0, 20, 40, 20], "m8[ms]")
+    tol = np.timedelta64(5, "ms")
+    assert find(a, t0 + 18 * ms, tolerance=tol) == 1
+    assert find_last(a, t0 + 18 * ms, tolerance=tol) == 3
+    assert find(a, t0 + 10 * ms, tolerance=tol) == -1
+    assert find(a, t0 + 15 * ms, tolerance=tol) == 1  # inclusive
+    assert find(a, t0 + 10 * ms, tolerance=tol, default=None) is None
+    assert find(a, t0 + 10 * ms, tolerance=datetime.timedelta(milliseconds=10)) == 0
+    assert find(a, t0 + 18 * ms, tolerance=np.timedelta64(0, "ms")) == -1
+    assert find(a, t0 + 20 * ms, tolerance=np.timedelta64(0, "ms")) == 1
+    with pytest.raises(ValueError):
+        find(a, t0 + 10 * ms, tolerance=tol, raises=True)
+    days = np.arange(np.datetime64("2023-01-20"), np.datetime64("2023-01-23"))
+    assert (
+        find(days, np.datetime64("2023-01-21T13"), tolerance=np.timedelta64(12, "h"))
+        == 2
+    )
+    assert np.array_equal(
+        find(a.reshape(2, 2), t0 + 38 * ms, tolerance=tol, axis=1), [-1, 0]
+    )
+    assert (
+        find(
+            np.array([10, 20], "m8[s]"),
+            np.timedelta64(19, "s"),
+            tolerance=np.timedelta64(1, "s"),
+        )
+        == 1
+    )
+
+
+def test_nat():
+    a = np.array([t0, np.datetime64("nat"), t0 + 20 * ms])
+    tol = np.timedelta64(5, "ms")
+    assert find(a, t0 + 21 * ms, tolerance=tol) == 2
+    assert find(a, np.datetime64("nat"), tolerance=tol) == 1
+    s = np.array([t0, t0 + 20 * ms, np.datetime64("nat")])
+    assert find(s, t0 + 30 * ms, tolerance=tol, sorted=True) == -1
+    assert find_last(s, t0 + 30 * ms, tolerance=tol, sorted=True) == -1
+    assert find_last(s, t0 + 24 * ms, tolerance=tol, sorted=True) == 1
+
+
+def test_sorted(small_chunks):
+    rng = np.random.default_rng(3)
+    a = t0 + np.sort(rng.integers(0, 1000, 100)).astype("m8[ms]")
+    tol = np.timedelta64(3, "ms")
+    for v in t0 + np.arange(-10, 1010, 7).astype("m8[ms]"):
+        hits = np.flatnonzero(np.abs(a - v) <= tol)
+        first = hits[0] if hits.shape[0] else -1
+        last = hits[-1] if hits.shape[0] else -1
+        assert find(a, v, tolerance=tol) == first
+        assert find(a, v, tolerance=tol, sorted=True) == first
+        assert find(a, v, tolerance=tol, workers=2) == first
+        assert find_last(a, v, tolerance=tol) == last
+        assert find_last(a, v, tolerance=tol, sorted=True) == last
+
+
+def test_sorted_nan():
+    assert find([1.0, np.nan], 5.0, sorted=True) == -1
+    assert find_last([1.0, 5.0, np.nan], 5.0, sorted=True) == 1
+
+
+def test_errors():
+    tol = np.timedelta64(5, "ms")
+    with pytest.raises(ValueError):
+        find([1, 2, 3], 2, tolerance=tol)
+    with pytest.raises(ValueError):
+        find(np.array([t0]), np.timedelta64(1, "ms"), tolerance=tol)
+    with pytest.raises(ValueError):
+        find(np.array([t0]), t0, tolerance=5)
+    with pytest.raises(ValueError):
+        find(np.array([t0]), t0, tolerance=-tol)
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+
+from npi import pyfind
+
+
+def neighbours(x, n):
+    res = [x]
+    for _ in range(n):
+        res.append(np.nextafter(res[-1], res[-1].dtype.type(np.inf)))
+    return res
+
+
+def test_ulps():
+    for dtype in (np.float16, np.float32, np.float64):
+        one = dtype(1)
+        a = np.array(neighbours(one, 5), dtype=dtype)
+        for ulps in range(4):
+            assert pyfind.find(a, a[4], ulps=ulps) == 4 - ulps, (dtype, ulps)
+            assert pyfind.find(a, a[4], ulps=ulps, sorted=True) == 4 - ulps
+            assert pyfind.find_last(a, a[1], ulps=ulps) == min(1 + ulps, 5)
+            assert pyfind.find_last(a, a[1], ulps=ulps, sorted=True) == min(1 + ulps, 5)
+
+
+def test_zero_and_special():
+    a = np.array([-0.0, 5e-324, 1.0, np.inf, np.nan])
+    assert pyfind.find(a, 0.0, ulps=0) == 0
+    assert pyfind.find(a, -5e-324, ulps=1) == 0
+    assert pyfind.find(a, -5e-324, ulps=0) == -1
+    assert pyfind.find(a, np.inf, ulps=3) == 3
+    assert pyfind.find(a, np.nan, ulps=3) == 4
+    big = np.finfo(np.float64).max
+    assert pyfind.find(a, big, ulps=10) == 3
+    assert pyfind.find(a[[0, 1, 2, 4]], big, ulps=10**18) == -1
+
+
+def test_random():
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=1000).astype(np.float32)
+    s = np.sort(a)
+    for v in a[:50]:
+        assert pyfind.find(a, v, ulps=0) == np.flatnonzero(a == v)[0]
+        assert pyfind.find(s, v, ulps=0, sorted=True) == np.searchsorted(s, v)
+    keys = a.view(np.int32).astype(np.int64)
+    keys = np.where(keys < 0, -(2**31) - keys, keys)
+    for v in a[:50]:
+        kv = keys[np.flatnonzero(a == v)[0]]
+        expected = np.flatnonzero(np.abs(keys - kv) <= 2**20)[0]
+        assert pyfind.find(a, v, ulps=2**20) == expected
+        assert pyfind.find(a.reshape(10, 100), v, ulps=2**20) == divmod(expected, 100)
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        pyfind.find([1, 2, 3], 2, ulps=1)
+    with pytest.raises(ValueError):
+        pyfind.find([1.0, 2.0], 2.0, ulps=-1)
+    with pytest.raises(ValueError):
+        pyfind.find(np.array([1.0], dtype=np.complex128), 1.0, ulps=1)
+    with pytest.raises(ValueError):
+        pyfind.find([1.0, 2.0], 2 + 0j, ulps=1)
+    with pytest.raises(TypeError):
+        pyfind.find([1.0, 2.0], 2.0, ulps=1.5)
+    with pytest.raises(TypeError):
+        pyfind.find([1.0, 2.0], 2.0, ulps=True)
+    assert pyfind.find([1.0, 2.0], 2.0, ulps=np.int64(0)) == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-s", "-x", __file__])